@@ -1,15 +1,13 @@
 """Download MP phonon docs."""
 
-import json
 import os
 from typing import TYPE_CHECKING
 
 from emmet.core.phonon import PhononBSDOSDoc
-from monty.io import zopen
-from monty.json import MontyEncoder
 from mp_api.client import MPRester
 
 from ffonons import DATA_DIR
+from ffonons.io import dump_ph_doc, load_ph_doc
 
 if TYPE_CHECKING:
     from pymatgen.core import Structure
@@ -38,12 +36,10 @@ def get_mp_ph_docs(
     mp_ph_doc_path = f"{docs_dir}/{id_formula}.json.lzma" if docs_dir else ""
 
     if os.path.isfile(mp_ph_doc_path):
-        with zopen(mp_ph_doc_path, mode="rt") as file:
-            mp_phonon_doc = json.load(file)
+        mp_phonon_doc = load_ph_doc(mp_ph_doc_path, decode=False)
     else:
         mp_phonon_doc = mp_rester.materials.phonon.get_data_by_id(mp_id)
         if mp_ph_doc_path:
-            with zopen(mp_ph_doc_path, mode="wt") as file:
-                json.dump(mp_phonon_doc, file, cls=MontyEncoder)
+            dump_ph_doc(mp_phonon_doc, mp_ph_doc_path)
 
     return mp_phonon_doc, mp_ph_doc_path
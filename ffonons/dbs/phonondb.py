@@ -6,13 +6,16 @@ which given a path to a zipped phonopy doc, returns a PhononDBDocParsed dataclas
 containing the parsed phonon data.
 """
 
-import copy
 import io
-import json
 import lzma
 import os
+import pickle
 import re
 import sys
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from glob import glob
 from typing import Any, Literal
@@ -22,30 +25,180 @@ import numpy as np
 import pandas as pd
 import phonopy
 import requests
+import scipy.constants as const
 import yaml
 from bs4 import BeautifulSoup
-from monty.json import MontyEncoder
 from phonopy.phonon.band_structure import get_band_qpoints_and_path_connections
 from phonopy.units import VaspToTHz
 from pymatgen.core import Structure
 from pymatgen.io.phonopy import get_ph_bs_symm_line_from_dict, get_pmg_structure
 from pymatgen.io.vasp import Kpoints
 from pymatgen.phonon import PhononBandStructureSymmLine, PhononDos
+from pymatgen.phonon.dos import BOLTZ_THZ_PER_K, THZ_TO_J
 from pymatgen.symmetry.bandstructure import HighSymmKpath
 from pymatgen.symmetry.kpath import KPathSeek
+from requests.adapters import HTTPAdapter
+from scipy.integrate import trapezoid
+from urllib3.util import Retry
 
 from ffonons import DATA_DIR
 from ffonons.enums import DB, KpathScheme, PhKey
+from ffonons.io import dump_ph_doc, glob_ph_docs
 
 __author__ = "Janine George, Aakash Naik, Janosh Riebesell"
 __date__ = "2023-12-07"
 
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # C impl if libyaml
+
 db_name = DB.phonon_db
 ph_docs_dir = f"{DATA_DIR}/{db_name}"
 
 id_map_path = f"{DATA_DIR}/{db_name}/map-mp-id-togo-id.csv"
-map_mp_to_togo_id = pd.read_csv(id_map_path, index_col=0)[PhKey.togo_id].to_dict()
-map_togo_to_mp_id = {val: key for key, val in map_mp_to_togo_id.items()}
+
+
+def load_mp_togo_id_maps(csv_path: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Load maps from MP to PhononDB (Togo) IDs and back.
+
+    Parsing the CSV with pandas on every import of this module is slow, so the maps
+    are cached in a pickle file next to the CSV which is reused as long as it's newer
+    than the CSV.
+
+    Args:
+        csv_path (str): Path to CSV file with mp_id and togo_id columns.
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]]: MP to Togo ID and Togo to MP ID maps.
+    """
+    pkl_path = f"{csv_path}.pkl"
+    if os.path.isfile(pkl_path) and os.path.getmtime(pkl_path) >= os.path.getmtime(
+        csv_path
+    ):
+        with open(pkl_path, mode="rb") as file:
+            return pickle.load(file)  # noqa: S301
+
+    mp_to_togo_id = pd.read_csv(csv_path, index_col=0)[PhKey.togo_id].to_dict()
+    togo_to_mp_id = {val: key for key, val in mp_to_togo_id.items()}
+    try:
+        with open(pkl_path, mode="wb") as file:
+            pickle.dump((mp_to_togo_id, togo_to_mp_id), file)
+    except OSError:  # e.g. read-only install, just don't cache
+        pass
+    return mp_to_togo_id, togo_to_mp_id
+
+
+map_mp_to_togo_id, map_togo_to_mp_id = load_mp_togo_id_maps(id_map_path)
+
+# file names of PhononDB zips and docs start with the MP ID, e.g. mp-149-xyz-pbe.zip
+MAT_ID_RE = re.compile(r"(mp-\d+)-")
+
+# share one session across all PhononDB requests to reuse keep-alive connections
+# instead of a new TCP + TLS handshake for each of the ~10k index pages and zips
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+# identify ourselves to the NIMS server instead of the generic python-requests agent
+http_session.headers["User-Agent"] = "ffonons (https://github.com/janosh/ffonons)"
+
+
+class RateLimiter:
+    """Thread-safe rate limiter that spaces out calls to wait() so that at most
+    max_rps of them return per second (across all threads).
+    """
+
+    def __init__(self, max_rps: float) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            max_rps (float): Maximum number of requests per second.
+        """
+        self.interval = 1 / max_rps
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request slot is free."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# stay polite to the NIMS server when downloading concurrently
+nims_rate_limiter = RateLimiter(max_rps=4)
+
+
+def download_file(url: str, out_path: str, *, timeout: float = 15) -> str:
+    """Stream a file to disk in 1 MiB chunks instead of buffering it in memory.
+
+    The download is written to out_path + ".part" first and only renamed to out_path
+    once complete so interrupted downloads don't leave truncated files behind.
+
+    Args:
+        url (str): URL to download.
+        out_path (str): Path to save the file to.
+        timeout (float): Seconds to wait for the server to respond. Defaults to 15.
+
+    Raises:
+        requests.HTTPError: If the server responds with an error status code.
+
+    Returns:
+        str: out_path
+    """
+    part_path = f"{out_path}.part"
+    nims_rate_limiter.wait()
+    with http_session.get(url, stream=True, timeout=timeout) as resp:
+        resp.raise_for_status()
+        with open(part_path, "wb") as file:
+            file.writelines(resp.iter_content(chunk_size=1 << 20))
+    os.replace(part_path, out_path)
+
+    return out_path
+
+
+def download_files(
+    urls_and_paths: Sequence[tuple[str, str]],
+    *,
+    max_workers: int = 8,
+    on_error: Literal["raise", "warn", "ignore"] = "warn",
+) -> list[str]:
+    """Download many files concurrently with download_file.
+
+    Downloads are I/O-bound, so threads sharing the keep-alive connection pool of
+    http_session overlap their network latency. All downloads go through
+    nims_rate_limiter to cap the request rate.
+
+    Args:
+        urls_and_paths (Sequence[tuple[str, str]]): (URL, out_path) pairs.
+        max_workers (int): Number of concurrent downloads. Defaults to 8.
+        on_error ("raise" | "warn" | "ignore"): What to do if a download fails with an
+            HTTP error. Defaults to "warn".
+
+    Returns:
+        list[str]: Paths of successfully downloaded files.
+    """
+
+    def download(url_and_path: tuple[str, str]) -> str | None:
+        try:
+            return download_file(*url_and_path)
+        except requests.HTTPError as exc:
+            if on_error == "raise":
+                raise
+            if on_error == "warn":
+                print(f"{url_and_path[0]} failed with {exc}", file=sys.stderr)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        out_paths = list(executor.map(download, urls_and_paths))
+
+    return [path for path in out_paths if path is not None]
 
 
 def fetch_togo_doc_by_id(doc_id: str, out_path: str = "") -> str:
@@ -72,29 +225,33 @@ def fetch_togo_doc_by_id(doc_id: str, out_path: str = "") -> str:
         return out_path
 
     download_url = f"https://mdr.nims.go.jp/download_all/{togo_id}.zip"
-    resp = requests.get(download_url, allow_redirects=True, timeout=15)
-
-    with open(out_path, "wb") as file:
-        file.write(resp.content)
-
-    return out_path
+    return download_file(download_url, out_path)
 
 
 def scrape_and_fetch_togo_docs_from_page(
-    url: str, on_error: Literal["raise", "warn", "ignore"] = "ignore"
-) -> pd.DataFrame | str:
+    url: str,
+    on_error: Literal["raise", "warn", "ignore"] = "ignore",
+    *,
+    download: bool = True,
+) -> list[dict[str, str]] | str:
     """Extract togo ID, MP ID from Togo DB index pages and download their phonopy files.
 
     Args:
         url (str): URL of the Togo DB index page
         on_error ("raise" | "warn" | "ignore"): what to do if an error occurs.
             Defaults to "raise".
+        download (bool): Whether to download the phonopy files on this page
+            concurrently. Set to False to only collect download URLs and out paths,
+            e.g. to batch-download files from many pages with download_files.
+            Defaults to True.
 
     Returns:
-        pd.DataFrame | str: DataFrame with togo ID, MP ID, and download URLs for
-            phonopy files. If an error occurs, returns the error message.
+        list[dict[str, str]] | str: One dict with keys mp_id, doc_id, url and
+            out_path per (downloaded) phonopy file. Plain dicts are cheap to build
+            per page and can be turned into a single DataFrame once all pages are
+            scraped. If an error occurs, returns the error message.
     """
-    response = requests.get(url, timeout=15)
+    response = http_session.get(url, timeout=15)
 
     if on_error == "raise":
         response.raise_for_status()
@@ -107,22 +264,16 @@ def scrape_and_fetch_togo_docs_from_page(
                 print(msg, file=sys.stderr)
             return msg
 
-    # parse the HTML content of the page
-    soup = BeautifulSoup(response.text, "html.parser")
+    # parse the HTML content of the page once with the libxml2-backed lxml parser
+    soup = BeautifulSoup(response.text, "lxml")
 
-    # extract all links from the page
-    tables = [
-        tr.prettify() for tr in soup.find_all("tr") if "document_" in tr.prettify()
-    ]
-
-    doc_ids, mp_ids, download_urls = [], [], []
-
-    for table in tables:
-        soup1 = BeautifulSoup(table, "html.parser")
+    rows: list[dict[str, str]] = []
 
+    # each PhononDB doc is listed as a table row with id="document_<togo_id>"
+    for table_row in soup.select('tr[id^="document_"]'):
         # find the relevant elements within the table row
-        doc_id = soup1.find("tr")["id"].split("_")[-1]
-        link_element = soup1.find_all("a", class_="")[0]
+        doc_id = table_row["id"].split("_")[-1]
+        link_element = table_row.find_all("a", class_="")[0]
         mp_id = f"mp-{link_element.text.strip().split()[-1]}"
         out_path = f"{ph_docs_dir}/{mp_id}-{doc_id}-pbe.zip"
 
@@ -130,48 +281,91 @@ def scrape_and_fetch_togo_docs_from_page(
             print(f"{out_path=} already exists. skipping")
             continue
 
-        doc_ids += [doc_id]
-        mp_ids += [mp_id]
-
         download_url = f"https://mdr.nims.go.jp/download_all/{doc_id}.zip"
-        resp = requests.get(download_url, allow_redirects=True, timeout=15)
-        if resp.status_code != 200:  # noqa: PLR2004
-            continue  # skip if download failed
-        download_urls += [download_url]
-        with open(out_path, "wb") as file:
-            file.write(resp.content)
+        rows += [dict(mp_id=mp_id, doc_id=doc_id, url=download_url, out_path=out_path)]
+
+    if download:  # skip files whose download failed
+        url_path_pairs = [(row["url"], row["out_path"]) for row in rows]
+        downloaded = set(download_files(url_path_pairs, on_error="ignore"))
+        rows = [row for row in rows if row["out_path"] in downloaded]
 
-    df_out = pd.DataFrame(index=mp_ids, columns=["doc_ids", "download_urls"])
-    df_out["doc_ids"] = doc_ids
-    df_out["download_urls"] = download_urls
+    return rows
 
-    return df_out
+
+def get_mat_id_from_path(path: str) -> str:
+    """Get the MP ID from a PhononDB zip or phonon doc path.
+
+    Args:
+        path (str): Path to a file whose name starts with the MP ID, e.g.
+            "data/phonon-db/mp-149-k3569900j-pbe.zip" or "mp-149-Si2-pbe.json.lzma".
+
+    Raises:
+        ValueError: If the file name doesn't start with an MP ID.
+
+    Returns:
+        str: MP ID, e.g. "mp-149".
+    """
+    if match := MAT_ID_RE.match(os.path.basename(path)):
+        return match[1]
+    raise ValueError(f"Invalid {path=}, file name must start with an MP ID")
+
+
+def index_ph_docs(paths: Sequence[str]) -> dict[str, list[str]]:
+    """Group PhononDB zip or phonon doc paths by MP ID with a single pass over
+    paths (e.g. from one directory listing) instead of globbing once per material.
+
+    Args:
+        paths (Sequence[str]): File paths whose names start with an MP ID.
+
+    Returns:
+        dict[str, list[str]]: Map from MP IDs to all matching paths.
+    """
+    index: dict[str, list[str]] = {}
+    for path in paths:
+        index.setdefault(get_mat_id_from_path(path), []).append(path)
+    return index
 
 
 def phonondb_doc_to_pmg_lzma(
     zip_path: str,
     *,
     pmg_doc_path: str | None = None,
-    existing: Literal["skip", "skip-silent", "overwrite", "raise"] = "skip",
+    existing: Literal["skip", "skip-silent", "update", "overwrite", "raise"] = "skip",
     on_read_error: Literal["raise", "warn", "ignore"] = "warn",
+    ext: Literal[".json.lzma", ".json.zst", ".msgpack.zst"] = ".json.lzma",
+    existing_docs: dict[str, list[str]] | None = None,
 ) -> tuple[Structure, dict[str, Any]]:
     """Convert a zipped phonon DB doc to a pymatgen Structure and dict of phonon data.
 
     Args:
         zip_path (str): path to the zipped phonon DB doc.
         pmg_doc_path (str, optional): path to save the pymatgen doc. Defaults to None.
-        existing ("skip" | "overwrite" | "raise"): What to do if output file already
-            exists. Defaults to "skip".
+        existing ("skip" | "skip-silent" | "update" | "overwrite" | "raise"): What to
+            do if output file already exists. "update" only re-parses the ZIP file if
+            it was modified after the existing doc was written. Defaults to "skip".
         on_read_error ("raise" | "warn" | "ignore"): What to do if an error occurs while
             reading the ZIP file. Defaults to "warn".
+        ext (".json.lzma" | ".json.zst" | ".msgpack.zst"): File extension (and hence
+            format and compression) of the pymatgen doc if pmg_doc_path is not given.
+            .zst (Zstandard) files are ~15x faster to decompress, msgpack ~3x faster
+            to parse than JSON but ~35% larger. Defaults to ".json.lzma".
+        existing_docs (dict[str, list[str]], optional): Map from MP IDs to paths of
+            existing pymatgen docs, e.g. from index_ph_docs(). Pass this when
+            converting many docs to avoid globbing ph_docs_dir once per ZIP file.
+            Only used if pmg_doc_path is not given. Defaults to None.
 
     Returns:
         tuple[Structure, dict[str, Any]]: Structure and dict of phonon data
     """
-    mat_id = "-".join(zip_path.split("/")[-1].split("-")[:2])
-
-    doc_path_patt = pmg_doc_path or f"{ph_docs_dir}/{mat_id}-*-pbe.json.lzma"
-    if matches := glob(doc_path_patt):
+    mat_id = get_mat_id_from_path(zip_path)
+
+    if pmg_doc_path:
+        matches = glob(pmg_doc_path)
+    elif existing_docs is not None:
+        matches = existing_docs.get(mat_id, [])
+    else:  # check for existing docs in any of the supported compression formats
+        matches = glob_ph_docs(ph_docs_dir, f"{mat_id}-*-pbe")
+    if matches:
         if existing == "skip-silent":
             return matches[0]
         if existing == "skip":
@@ -179,7 +373,11 @@ def phonondb_doc_to_pmg_lzma(
             return matches[0]
         if existing == "raise":
             raise RuntimeError(f"{matches[0]} already exists.")
-        # else: overwrite i.e. continue
+        if existing == "update" and os.path.getmtime(matches[0]) >= os.path.getmtime(
+            zip_path
+        ):
+            return matches[0]  # doc is up to date, skip expensive phonopy parsing
+        # else: overwrite (or update stale doc) i.e. continue
 
     try:
         phonondb_doc = parse_phonondb_docs(zip_path, is_nac=False)
@@ -190,17 +388,11 @@ def phonondb_doc_to_pmg_lzma(
             print(exc, file=sys.stderr)
             return None
 
-    if not re.match(r"mp-\d+", mat_id):
-        raise ValueError(f"Invalid {mat_id=}")
-
     if pmg_doc_path is None:
         formula = phonondb_doc.structure.formula.replace(" ", "")
-        pmg_doc_path = f"{ph_docs_dir}/{mat_id}-{formula}-pbe.json.lzma"
+        pmg_doc_path = f"{ph_docs_dir}/{mat_id}-{formula}-pbe{ext}"
 
-    with lzma.open(pmg_doc_path, "wt") as file:
-        json.dump(phonondb_doc, file, cls=MontyEncoder)
-
-    return pmg_doc_path
+    return dump_ph_doc(phonondb_doc, pmg_doc_path)
 
 
 def get_phonopy_kpath(
@@ -230,14 +422,75 @@ def get_phonopy_kpath(
             f"Invalid {kpath_scheme=}, must be one of {[*map(str, KpathScheme)]}"
         )
 
-    path = copy.deepcopy(kpath["path"])
-
-    for path_idx, label_set in enumerate(kpath["path"]):
-        for label_idx, label in enumerate(label_set):
-            path[path_idx][label_idx] = kpath["kpoints"][label]
+    path = [
+        [kpath["kpoints"][label] for label in label_set] for label_set in kpath["path"]
+    ]
     return kpath["kpoints"], path
 
 
+def get_thermo_props(
+    ph_dos: PhononDos, temps: Sequence[float], structure: Structure | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute vibrational thermodynamic properties from a phonon DOS at many
+    temperatures at once.
+
+    Equivalent to calling PhononDos.helmholtz_free_energy, .entropy,
+    .internal_energy and .cv for each temperature but integrates over the DOS for all
+    temperatures in a single vectorized pass instead of 4 * len(temps) Python calls.
+
+    Args:
+        ph_dos (PhononDos): Phonon DOS. Only positive frequencies contribute.
+        temps (Sequence[float]): Temperatures in K.
+        structure (Structure | None): If given, properties are normalized per formula
+            unit (like in pymatgen), else per unit cell of the DOS. Defaults to None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Free energies (J/mol),
+            entropies (J/K/mol), internal energies (J/mol) and heat capacities
+            (J/K/mol), each of shape (len(temps),).
+    """
+    is_pos_freq = ph_dos.frequencies > 0
+    freqs, dens = ph_dos.frequencies[is_pos_freq], ph_dos.densities[is_pos_freq]
+    temps = np.asarray(temps, dtype=float)
+    is_finite_temp = temps > 0
+
+    # at T=0, free and internal energy reduce to the zero-point energy, S and Cv to 0
+    zpe = trapezoid(freqs * dens, x=freqs) / 2 * THZ_TO_J * const.Avogadro
+    free_energies, internal_energies = np.full((2, len(temps)), zpe)
+    entropies, heat_capacities = np.zeros((2, len(temps)))
+
+    # h*nu / (2*k_B*T) with shape (n_temps, n_freqs), shared by all 4 integrands
+    wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temps[is_finite_temp, None])
+    # sinh(x) overflows for h*nu >> k_B*T (low T, high freqs). write it as
+    # 2*sinh(x) = e^x * (1 - e^-2x) and use expm1 which stays finite and accurate for
+    # all x > 0, so log(2*sinh(x)) and csch(x)^2 can't overflow to inf/nan
+    one_minus_exp = -np.expm1(-2 * wd2kt)
+    log_2sinh, coth = wd2kt + np.log(one_minus_exp), 1 / np.tanh(wd2kt)
+    csch_sq = 4 * np.exp(-2 * wd2kt) / one_minus_exp**2
+    k_b_n_a = const.Boltzmann * const.Avogadro
+
+    free_energies[is_finite_temp] = (
+        trapezoid(log_2sinh * dens, x=freqs, axis=-1) * k_b_n_a * temps[is_finite_temp]
+    )
+    entropies[is_finite_temp] = k_b_n_a * trapezoid(
+        (wd2kt * coth - log_2sinh) * dens, x=freqs, axis=-1
+    )
+    internal_energies[is_finite_temp] = (
+        trapezoid(freqs * coth * dens, x=freqs, axis=-1) / 2 * THZ_TO_J * const.Avogadro
+    )
+    heat_capacities[is_finite_temp] = k_b_n_a * trapezoid(
+        wd2kt**2 * csch_sq * dens, x=freqs, axis=-1
+    )
+
+    thermo_props = (free_energies, entropies, internal_energies, heat_capacities)
+    if structure is not None:
+        comp = structure.composition
+        formula_units = comp.num_atoms / comp.reduced_composition.num_atoms
+        thermo_props = tuple(vals / formula_units for vals in thermo_props)
+
+    return thermo_props
+
+
 @dataclass
 class PhononDBDocParsed:
     """Dataclass for phonon DB docs."""
@@ -305,10 +558,18 @@ def parse_phonondb_docs(
         symprec (float, optional): precision for symmetry determination.
             Defaults to 1e-5.
         out_dir (str, optional): path to output directory. Defaults to None.
-            Must be specified if passing "band_structure_eigenvectors" as kwargs.
+            Must be specified if passing "band_structure_eigenvectors" or
+            "create_thermal_displacements" as kwargs.
         delete_unreadable (bool, optional): whether to delete unreadable files.
             Defaults to True.
-        **kwargs: additional parameters that can be passed to this method as a dict
+        **kwargs: additional parameters that can be passed to this method as a dict.
+            E.g. decimals (int | None) to round band structure and DOS frequencies,
+            thermodynamic properties and thermal displacements to right before
+            returning the doc. All properties are computed from unrounded data.
+            decimals=6 (i.e. 1e-6 THz for frequencies) is well below phonopy's
+            numerical accuracy but about halves the size of compressed JSON docs.
+            Note that thermal displacements (~1e-2 Å^2) keep only ~4 significant
+            digits at 6 decimals. Defaults to None (no rounding).
 
     Returns:
         PhononDBDoc: dataclass with phonon data
@@ -318,12 +579,26 @@ def parse_phonondb_docs(
     else:
         raise ValueError(f"Invalid {code=}, only 'vasp' is supported.")
 
+    # read optional outputs once and validate them before any expensive phonopy calls
+    with_bs_eig_vecs = kwargs.get("band_structure_eigenvectors", False)
+    with_therm_disp = bool(kwargs.get("create_thermal_displacements"))
+    if (with_bs_eig_vecs or with_therm_disp) and out_dir is None:
+        raise ValueError(
+            "Specify out_dir if passing 'band_structure_eigenvectors' or "
+            "'create_thermal_displacements' as kwargs"
+        )
+
     if phonopy_doc_path:
-        # open zip archive and only read the phonopy_params.yaml.xz file from it
+        # open zip archive and only read the phonopy_params.yaml.xz file from it.
+        # decompress it in one go so the zip is closed right away (no file handles
+        # leaked into worker processes) and phonopy parses from an in-memory buffer
         try:
-            with ZipFile(phonopy_doc_path) as zip_file:
-                yaml_xz = zip_file.open("phonopy_params.yaml.xz")
-                phonopy_params = lzma.open(yaml_xz, "rt")
+            with (
+                ZipFile(phonopy_doc_path) as zip_file,
+                zip_file.open("phonopy_params.yaml.xz") as yaml_xz,
+            ):
+                yaml_bytes = lzma.decompress(yaml_xz.read())
+            phonopy_params = io.StringIO(yaml_bytes.decode())
         except Exception as exc:
             exc.add_note(f"Failed to load {phonopy_doc_path=}")
             if delete_unreadable:
@@ -343,9 +618,10 @@ def parse_phonondb_docs(
             is_nac=is_nac,
         )
 
-    pmg_struct = get_pmg_structure(phonon.primitive)
+    # convert primitive cell once, reused for k-path, DOS k-mesh and thermo props
+    struct = get_pmg_structure(phonon.primitive)
     k_path_dict, k_path_concrete = get_phonopy_kpath(
-        structure=pmg_struct, kpath_scheme=kpath_scheme, symprec=symprec
+        structure=struct, kpath_scheme=kpath_scheme, symprec=symprec
     )
 
     q_points, connections = get_band_qpoints_and_path_connections(
@@ -354,7 +630,6 @@ def parse_phonondb_docs(
 
     # phonon band structures will always be computed
     # TODO: potentially add kwargs to avoid computation of eigenvectors
-    with_bs_eig_vecs = kwargs.get("band_structure_eigenvectors", False)
     phonon.run_band_structure(
         q_points,
         path_connections=connections,
@@ -365,8 +640,11 @@ def parse_phonondb_docs(
     # convert bands to pymatgen PhononBandStructureSymmLine
     bands_io = io.StringIO()  # create in-memory io like like object to write yaml to
     phonon._band_structure._write_yaml(w=bands_io, comment=None)  # noqa: SLF001
-    # parse bands_io.getvalue() as YAML
-    bands_dict = yaml.safe_load(bands_io.getvalue())
+    # parse YAML with libyaml if available (much faster than pure-Python safe_load for
+    # the 100s of q-points x 3*n_atoms bands). read from the rewound buffer directly
+    # instead of copying its whole content into a new string with getvalue()
+    bands_io.seek(0)
+    bands_dict = yaml.load(bands_io, Loader=YamlSafeLoader)  # noqa: S506
     bs_symm_line = get_ph_bs_symm_line_from_dict(
         bands_dict,
         labels_dict=k_path_dict,
@@ -375,27 +653,30 @@ def parse_phonondb_docs(
 
     # will determine if imaginary modes are present in the structure
     imag_freq_tol = kwargs.get("tol_imaginary_modes", 1e-5)
-    # convert np.bool to Python bool
-    has_imag_modes = bool(bs_symm_line.has_imaginary_freq(tol=imag_freq_tol))
+    # same as bs_symm_line.has_imaginary_freq(tol=imag_freq_tol) but without looking
+    # up the q-point of the lowest band. convert np.bool to Python bool
+    has_imag_modes = bool(bs_symm_line.bands.min() < -imag_freq_tol)
 
     # gets data for visualization on website - yaml is also enough
-    if kwargs.get("band_structure_eigenvectors"):
-        if out_dir is None:
-            raise ValueError(
-                "Specify out_dir if passing 'band_structure_eigenvectors' as kwargs"
-            )
+    if with_bs_eig_vecs:
         os.makedirs(out_dir, exist_ok=True)
         bs_symm_line.write_phononwebsite(f"{out_dir}/phonon-website.json")
 
     # convert phonon DOS to pymatgen PhononDos
     kpoint_density_dos = kwargs.get("kpoint_density_dos", 7000)
-    struct = get_pmg_structure(phonon.primitive)
     kpoint = Kpoints.automatic_density(
         structure=struct,
         kppa=kpoint_density_dos,
         force_gamma=True,
     )
-    phonon.run_mesh(kpoint.kpts[0])
+    # thermal displacements need eigenvectors on the full (non-symmetry-reduced) mesh.
+    # if requested, run that mesh once and compute the DOS from it too instead of
+    # running a cheaper mesh for the DOS and recomputing it with eigenvectors later
+    phonon.run_mesh(
+        kpoint.kpts[0],
+        with_eigenvectors=with_therm_disp,
+        is_mesh_symmetry=not with_therm_disp,
+    )
     phonon.run_total_dos()
     ph_dos = PhononDos(
         frequencies=phonon.total_dos.frequency_points, densities=phonon.total_dos.dos
@@ -406,24 +687,12 @@ def parse_phonondb_docs(
         kwargs.get("tmin", 0), kwargs.get("tmax", 500), kwargs.get("tstep", 10)
     )
 
-    free_energies = [
-        ph_dos.helmholtz_free_energy(temp=temp, structure=struct) for temp in temp_range
-    ]
-
-    entropies = [ph_dos.entropy(temp=temp, structure=struct) for temp in temp_range]
-
-    internal_energies = [
-        ph_dos.internal_energy(temp=temp, structure=struct) for temp in temp_range
-    ]
-
-    heat_capacities = [ph_dos.cv(temp=temp, structure=struct) for temp in temp_range]
+    thermo_props = get_thermo_props(ph_dos, temp_range, structure=struct)
 
     # will compute thermal displacement matrices
     # for the primitive cell (phonon.primitive!)
     # only this is available in phonopy
-    therm_disp_mat = therm_disp_mat_cif = None  # initialize
-    if kwargs.get("create_thermal_displacements"):
-        phonon.run_mesh(kpoint.kpts[0], with_eigenvectors=True, is_mesh_symmetry=False)
+    if with_therm_disp:
         freq_min_thermal_displacements = kwargs.get("freq_min_thermal_displacements", 0)
         t_min, t_max, t_step = (
             kwargs.get(f"{key}_thermal_displacements", val)
@@ -438,25 +707,46 @@ def parse_phonondb_docs(
 
         temp_range_thermal_displacements = np.arange(t_min, t_max, t_step)
         os.makedirs(out_dir, exist_ok=True)
+        td_matrices = phonon.thermal_displacement_matrices
         for idx, temp in enumerate(temp_range_thermal_displacements):
             cif_path = f"{out_dir}/therm-displace-mat-{temp}K.cif"
+            td_matrices.write_cif(phonon.primitive, idx, filename=cif_path)
 
-            phonon.thermal_displacement_matrices.write_cif(
-                phonon.primitive, idx, filename=cif_path
-            )
-        td_matrices = phonon._thermal_displacement_matrices  # noqa: SLF001
-        therm_disp_mat = td_matrices.thermal_displacement_matrices.tolist()
-
-        therm_disp_mat_cif = td_matrices.thermal_displacement_matrices_cif.tolist()
+        # keep matrices as numpy arrays, only converted when serializing the doc
+        # (MontyEncoder for JSON, raw bytes for msgpack in ffonons.io.dump_ph_doc)
         thermal_displacements = {
-            "temps_thermal_displacements": temp_range_thermal_displacements.tolist(),
-            "thermal_displacement_matrix_cif": therm_disp_mat_cif,
-            "thermal_displacement_matrix": therm_disp_mat,
+            "temps_thermal_displacements": temp_range_thermal_displacements,
+            "thermal_displacement_matrix_cif": (
+                td_matrices.thermal_displacement_matrices_cif
+            ),
+            "thermal_displacement_matrix": td_matrices.thermal_displacement_matrices,
             "freq_min_thermal_displacements": freq_min_thermal_displacements,
         }
     else:
         thermal_displacements = None
 
+    # optionally drop digits below phonopy's numerical accuracy for smaller, more
+    # compressible docs. only done here when packaging the doc so that all derived
+    # quantities above are computed from unrounded data
+    if (decimals := kwargs.get("decimals")) is not None:
+        bs_symm_line.bands = np.round(bs_symm_line.bands, decimals)
+        ph_dos = PhononDos(
+            frequencies=np.round(ph_dos.frequencies, decimals),
+            densities=np.round(ph_dos.densities, decimals),
+        )
+        thermo_props = [np.round(vals, decimals) for vals in thermo_props]
+        if thermal_displacements is not None:
+            for key in (
+                "thermal_displacement_matrix_cif",
+                "thermal_displacement_matrix",
+            ):
+                thermal_displacements[key] = np.round(
+                    thermal_displacements[key], decimals
+                )
+    free_energies, entropies, internal_energies, heat_capacities = (
+        vals.tolist() for vals in thermo_props
+    )
+
     return PhononDBDocParsed(
         structure=get_pmg_structure(phonon.unitcell),
         primitive=struct,
@@ -2,22 +2,32 @@
 band structures and DOSs from disk.
 """
 
+import hashlib
 import json
+import math
+import multiprocessing
 import os
+import pickle
 import re
-from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import UTC, datetime
+from fnmatch import fnmatchcase
 from glob import glob
+from itertools import groupby, islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import IO, TYPE_CHECKING, Any, Literal
 from zipfile import ZipFile
 
+import msgpack
 import numpy as np
+import orjson
 import pandas as pd
+import zstandard
 from atomate2.common.schemas.phonons import PhononBSDOSDoc
 from monty.io import zopen
-from monty.json import MontyDecoder
+from monty.json import MontyDecoder, MontyEncoder
 from pymatgen.core import Structure
 from pymatviz.enums import Key
 from tqdm import tqdm
@@ -34,17 +44,218 @@ __date__ = "2023-11-24"
 
 
 PhDocs = dict[str, dict[str, PhononBSDOSDoc | PhononDBDocParsed]]
+# file extensions of compressed phonon docs. Zstandard (.zst) at level 19 compresses
+# as well as LZMA but decompresses ~15x faster. msgpack stores floats as binary
+# instead of decimal text which makes (de)serialization several times faster
+PH_DOC_EXTS = (".json.gz", ".json.lzma", ".json.zst", ".msgpack.zst")
+# parse MP ID, formula and model from phonon doc file names like
+# "mp-149-Si2-mace-mp-0.json.lzma". match against os.path.basename(path) so the regex
+# engine doesn't have to backtrack over the directory prefix
+PH_DOC_PATH_RE = re.compile(r"(mp-\d+)-([A-Z][^-]+)-(.*)\.(?:json|msgpack)\.")
+# column dtypes of get_df_summary() DataFrames
+SUMMARY_DTYPES = {
+    Key.formula: "string",
+    Key.n_sites: "Int64",
+    Key.supercell: "string",
+    Key.last_ph_dos_peak: "Float64",
+    Key.max_ph_freq: "Float64",
+    Key.min_ph_freq: "Float64",
+    Key.ph_dos_mae: "Float64",
+    PhKey.ph_dos_r2: "Float64",
+    Key.has_imag_ph_modes: "boolean",
+    Key.has_imag_ph_gamma_modes: "boolean",
+}
+MSGPACK_NDARRAY_EXT = 1  # msgpack extension type code for numpy arrays
+# let MontyEncoder handle dataclasses (adds @module/@class) and datetimes like the
+# stdlib json encoder did. numpy arrays also go through MontyEncoder to keep their
+# dtype on round trips
+ORJSON_OPTS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+def open_ph_doc(path: str, mode: str = "rt") -> IO:
+    """Open a compressed phonon doc for reading or writing.
+
+    Like monty's zopen (which handles .gz, .lzma, .xz, .bz2 files) but also supports
+    Zstandard-compressed .zst files.
 
+    Args:
+        path (str): Path to the file. Compression is inferred from the extension.
+        mode (str): File mode, must include "t" or "b". Defaults to "rt".
 
-def load_pymatgen_phonon_docs(
+    Returns:
+        IO: File object.
+    """
+    if str(path).endswith(".zst"):
+        cctx = zstandard.ZstdCompressor(level=19) if "w" in mode else None
+        encoding = "utf-8" if "t" in mode else None
+        return zstandard.open(path, mode=mode, cctx=cctx, encoding=encoding)
+    return zopen(path, mode=mode)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode objects msgpack can't natively serialize. Numeric numpy arrays are
+    stored as raw bytes with a dtype and shape header, everything else is handled
+    like in monty's MontyEncoder (e.g. as_dict() for MSONable objects).
+    """
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in "biufc":
+        arr = np.ascontiguousarray(obj)
+        payload = msgpack.packb([arr.dtype.str, arr.shape, arr.tobytes()])
+        return msgpack.ExtType(MSGPACK_NDARRAY_EXT, payload)
+    return MontyEncoder().default(obj)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Decode numpy arrays written by _msgpack_default."""
+    if code == MSGPACK_NDARRAY_EXT:
+        dtype, shape, buffer = msgpack.unpackb(data)
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape).copy()
+    return msgpack.ExtType(code, data)
+
+
+def _fork_pool(n_workers: int | None) -> ProcessPoolExecutor:
+    """Process pool using the fork start method so workers don't re-import and
+    re-run the calling script as they would with the spawn default on macOS.
+    """
+    return ProcessPoolExecutor(
+        n_workers, mp_context=multiprocessing.get_context("fork")
+    )
+
+
+def _json_loads(json_bytes: bytes) -> Any:
+    """Parse JSON with orjson, falling back to the stdlib json module for docs
+    containing NaN/Infinity tokens (written by json.dumps) which orjson rejects.
+    """
+    try:
+        return orjson.loads(json_bytes)
+    except orjson.JSONDecodeError:
+        return json.loads(json_bytes)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check if a JSON-native object (dict/list/float nesting) contains NaN or inf.
+    Numeric lists are checked in one go with numpy. Other types are skipped as they
+    pass through the encoder's default hook, where they're checked after encoding.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, list | tuple):
+        try:
+            return not np.isfinite(np.asarray(obj, dtype=float)).all()
+        except (TypeError, ValueError):  # ragged or non-numeric list
+            return any(map(_has_non_finite, obj))
+    return False
+
+
+def load_ph_doc(path: str, *, decode: bool = True) -> Any:
+    """Load a phonon doc from a compressed JSON or msgpack file.
+
+    Args:
+        path (str): Path to a file with one of the extensions in PH_DOC_EXTS.
+        decode (bool): Whether to convert the loaded dict to pymatgen/atomate2
+            objects with monty's MontyDecoder. Defaults to True.
+
+    Returns:
+        PhononBSDOSDoc | PhononDBDocParsed | dict: Phonon doc (or dict if not decode)
+    """
+    if path.endswith(".msgpack.zst"):
+        with open_ph_doc(path, mode="rb") as file:
+            ph_doc = msgpack.unpackb(
+                file.read(), ext_hook=_msgpack_ext_hook, strict_map_key=False
+            )
+        return MontyDecoder().process_decoded(ph_doc) if decode else ph_doc
+
+    # orjson parses JSON several times faster than the stdlib json module
+    with open_ph_doc(path, mode="rb") as file:
+        ph_doc = _json_loads(file.read())
+    return MontyDecoder().process_decoded(ph_doc) if decode else ph_doc
+
+
+def dump_ph_doc(ph_doc: Any, path: str) -> str:
+    """Write a phonon doc to a compressed JSON or msgpack file.
+
+    NaN and inf values are preserved. orjson would silently write them as null, so
+    JSON docs containing them are written with the stdlib json module instead which
+    emits NaN/Infinity tokens (non-standard JSON, but read back by load_ph_doc).
+
+    Args:
+        ph_doc (PhononBSDOSDoc | PhononDBDocParsed | dict): Phonon doc to save.
+        path (str): Output path. Serialization format and compression are inferred
+            from the extension which must be one of PH_DOC_EXTS.
+
+    Returns:
+        str: path
+    """
+    if path.endswith(".msgpack.zst"):
+        with open_ph_doc(path, mode="wb") as file:
+            file.write(msgpack.packb(ph_doc, default=_msgpack_default))
+    else:
+        has_non_finite = _has_non_finite(ph_doc)
+
+        def default(obj: Any) -> Any:
+            nonlocal has_non_finite
+            encoded = MontyEncoder().default(obj)
+            has_non_finite = has_non_finite or _has_non_finite(encoded)
+            return encoded
+
+        json_bytes = orjson.dumps(ph_doc, default=default, option=ORJSON_OPTS)
+        if has_non_finite:
+            json_bytes = json.dumps(ph_doc, cls=MontyEncoder).encode()
+        with open_ph_doc(path, mode="wb") as file:
+            file.write(json_bytes)
+
+    return path
+
+
+def glob_ph_docs(directory: str, pattern: str = "*") -> list[str]:
+    """Get paths of all phonon docs in a directory matching a glob pattern.
+
+    Args:
+        directory (str): Directory to search.
+        pattern (str): Glob pattern for file names without the file extension, which
+            can be any of PH_DOC_EXTS. Defaults to "*".
+
+    Returns:
+        list[str]: Paths to matching phonon docs.
+    """
+    if not os.path.isdir(directory):
+        return []
+    # list the directory once instead of globbing once per extension which matters
+    # for large dirs on network file systems
+    paths = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            ext = next((ext for ext in PH_DOC_EXTS if entry.name.endswith(ext)), None)
+            # like glob, don't match hidden files unless pattern starts with a dot
+            if ext is None or (entry.name[0] == "." and not pattern.startswith(".")):
+                continue
+            if fnmatchcase(entry.name.removesuffix(ext), pattern):
+                paths += [entry.path]
+    return paths
+
+
+def _load_ph_doc_or_exc(path: str) -> Any:
+    """Load a phonon doc but return instead of raise exceptions so that a single bad
+    file doesn't abort loading all others in a process pool.
+    """
+    try:
+        return load_ph_doc(path)
+    except Exception as exc:
+        return exc
+
+
+def get_ph_doc_paths(
     docs_to_load: Literal["mp", "phonon-db"] | Sequence[str],
     *,
     materials_ids: Sequence[str] = (),
     glob_patt: str = "",
-    verbose: bool = True,
-) -> PhDocs:
-    """Load existing DFT/ML phonon band structure and DOS docs from disk for a
-    specified database.
+) -> list[str]:
+    """Get file paths of phonon docs to load for a database.
 
     Args:
         docs_to_load ("mp" | "phonon-db" | Sequence[str]): Database name to load docs
@@ -53,68 +264,211 @@ def load_pymatgen_phonon_docs(
         glob_patt (str): Glob pattern to match files to load from the database
             directory. Defaults to "". If set, only files matching this pattern will be
             loaded. Ignored if docs_to_load is a list of file paths.
-        verbose (bool): Whether to print progress bar. Defaults to True.
+
+    Raises:
+        TypeError: If docs_to_load is neither a str nor a list of str.
+        FileNotFoundError: If no matching files are found.
 
     Returns:
-        dict[str, dict[str, dict]]: Outer key is material ID, 2nd-level key is the model
-            name (or DFT) mapped to a PhononBSDOSDoc.
+        list[str]: Paths to phonon docs.
     """
     from ffonons import DATA_DIR
 
     if len(docs_to_load) == 0:
-        return {}
+        return []
     if isinstance(docs_to_load, str):
         if glob_patt == "":
-            paths = glob(f"{DATA_DIR}/{docs_to_load}/*.json.gz") + glob(
-                f"{DATA_DIR}/{docs_to_load}/*.json.lzma"
-            )
+            paths = glob_ph_docs(f"{DATA_DIR}/{docs_to_load}")
         else:
             paths = glob(f"{DATA_DIR}/{docs_to_load}/{glob_patt}")
     elif {*map(type, docs_to_load)} == {str}:
-        paths = docs_to_load
+        paths = list(docs_to_load)
     else:
         raise TypeError(f"Invalid {docs_to_load=}, should be str or list of str")
 
     if materials_ids:
+        # parse each file's MP ID once and look it up in a set instead of substring
+        # searching every path for every ID (which also let mp-1 match mp-10)
+        mat_id_set = set(materials_ids)
         paths = [
-            path for path in paths if any(mp_id in path for mp_id in materials_ids)
+            path
+            for path in paths
+            if (match := PH_DOC_PATH_RE.match(os.path.basename(path)))
+            and match[1] in mat_id_set
         ]
 
     if len(paths) == 0:
         raise FileNotFoundError(f"No files found in {DATA_DIR}/{docs_to_load}")
 
-    ph_docs = defaultdict(dict)
+    return paths
 
-    pbar = tqdm(paths, desc=f"Loading {len(paths)} docs")
-    for path in pbar if verbose else paths:
-        if verbose:
-            pbar.set_postfix_str(path.split("/")[-1])
-        try:
-            with zopen(path, mode="rt") as file:
-                ph_doc: PhononBSDOSDoc | PhononDBDocParsed = json.load(
-                    file, cls=MontyDecoder
-                )
-        except Exception as exc:
-            print(f"error loading {path=}: {exc}")
-            continue
 
-        path_regex = r".*/(mp-\d+)-([A-Z][^-]+)-(.*).json.*"
+def iter_pymatgen_phonon_docs(
+    docs_to_load: Literal["mp", "phonon-db"] | Sequence[str],
+    *,
+    materials_ids: Sequence[str] = (),
+    glob_patt: str = "",
+    verbose: bool = True,
+    n_workers: int = 1,
+) -> Iterator[tuple[str, dict[str, PhononBSDOSDoc | PhononDBDocParsed]]]:
+    """Lazily load phonon docs one material at a time. Unlike
+    load_pymatgen_phonon_docs, only one material's docs need to be in memory at once
+    (when n_workers=1) so this scales to databases that don't fit in RAM.
+
+    Args:
+        docs_to_load ("mp" | "phonon-db" | Sequence[str]): Database name to load docs
+            for or list of file paths to load.
+        materials_ids (Sequence[str]): List of material IDs to load. Defaults to ().
+        glob_patt (str): Glob pattern to match files to load from the database
+            directory. Defaults to "". Ignored if docs_to_load is a list of file paths.
+        verbose (bool): Whether to print progress bar. Defaults to True.
+        n_workers (int): Number of processes to decompress and decode docs in
+            parallel. Workers run ahead of the consumer so memory is no longer bounded
+            to one material. Defaults to 1 (no pool).
+
+    Yields:
+        tuple[str, dict[str, PhononBSDOSDoc | PhononDBDocParsed]]: Material ID and
+            dict mapping model names (or DFT) to phonon docs.
+    """
+    paths = get_ph_doc_paths(
+        docs_to_load, materials_ids=materials_ids, glob_patt=glob_patt
+    )
+    if len(paths) == 0:
+        return
+
+    # parse (mat_id, model) from all paths up front to fail fast on bad file names
+    # before any slow loading. sorting makes each material's docs contiguous so they
+    # can be grouped into one dict per material
+    path_keys = {path: _parse_ph_doc_path(path) for path in paths}
+    # if a doc exists in several formats (e.g. after migrate_to_zstd without
+    # remove_old), only load the copy in the fastest-to-load format
+    paths = sorted(paths, key=lambda path: (*path_keys[path], _ph_doc_load_rank(path)))
+    paths = [next(group) for _, group in groupby(paths, key=path_keys.__getitem__)]
+
+    pool = _fork_pool(n_workers) if n_workers > 1 else nullcontext()
+    with pool as executor:
+        if executor is None:
+            loaded_docs = map(_load_ph_doc_or_exc, paths)
+        else:
+            loaded_docs = executor.map(_load_ph_doc_or_exc, paths, chunksize=4)
         try:
-            mp_id, _formula, model = re.search(path_regex, path).groups()
-        except (ValueError, AttributeError):
-            raise ValueError(
-                f"Can't parse MP ID and model from {path=}, should match {path_regex=}"
-            ) from None
-        if not mp_id.startswith("mp-"):
-            raise ValueError(f"Invalid {mp_id=}")
-
-        ph_doc.file_path = path
-        setattr(ph_doc, Key.mat_id, mp_id)
-        ph_docs[mp_id][model] = ph_doc
+            pbar = tqdm(
+                zip(paths, loaded_docs, strict=True),
+                total=len(paths),
+                desc=f"Loading {len(paths)} docs",
+                disable=not verbose,
+            )
+            for mp_id, group in groupby(pbar, key=lambda pair: path_keys[pair[0]][0]):
+                mat_docs = {}
+                for path, ph_doc in group:
+                    if isinstance(ph_doc, Exception):
+                        print(f"error loading {path=}: {ph_doc}")
+                        continue
+                    ph_doc.file_path = path
+                    setattr(ph_doc, Key.mat_id, mp_id)
+                    mat_docs[path_keys[path][1]] = ph_doc
+                if mat_docs:
+                    yield mp_id, mat_docs
+        finally:
+            # if the caller stops iterating early, cancel pending loads instead of
+            # waiting for docs that will never be consumed
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+
+def load_pymatgen_phonon_docs(
+    docs_to_load: Literal["mp", "phonon-db"] | Sequence[str],
+    *,
+    materials_ids: Sequence[str] = (),
+    glob_patt: str = "",
+    verbose: bool = True,
+    n_workers: int = 1,
+    cache_dir: str = "",
+) -> PhDocs:
+    """Load existing DFT/ML phonon band structure and DOS docs from disk for a
+    specified database.
+
+    Args:
+        docs_to_load ("mp" | "phonon-db" | Sequence[str]): Database name to load docs
+            for or list of file paths to load.
+        materials_ids (Sequence[str]): List of material IDs to load. Defaults to ().
+        glob_patt (str): Glob pattern to match files to load from the database
+            directory. Defaults to "". If set, only files matching this pattern will be
+            loaded. Ignored if docs_to_load is a list of file paths.
+        verbose (bool): Whether to print progress bar. Defaults to True.
+        n_workers (int): Number of processes to decompress and decode docs in
+            parallel. Loading is CPU-bound (LZMA + JSON + MontyDecoder) so this scales
+            about linearly with cores for many docs. Defaults to 1 (no pool).
+        cache_dir (str): If set, pickle the loaded docs to a Zstandard-compressed
+            file in this directory keyed by the hash of all file paths and
+            modification times. Later calls with unchanged files unpickle that
+            instead of decoding every doc again. Defaults to "" (no caching).
+
+    Returns:
+        dict[str, dict[str, dict]]: Outer key is material ID, 2nd-level key is the model
+            name (or DFT) mapped to a PhononBSDOSDoc.
+    """
+    paths = get_ph_doc_paths(
+        docs_to_load, materials_ids=materials_ids, glob_patt=glob_patt
+    )
+    if len(paths) == 0:
+        return {}
+
+    cache_path = ""
+    if cache_dir:
+        paths_mtimes = sorted((path, os.path.getmtime(path)) for path in paths)
+        cache_key = hashlib.sha256(repr(paths_mtimes).encode()).hexdigest()[:16]
+        cache_path = f"{cache_dir}/ph-docs-{cache_key}.pkl.zst"
+        if os.path.isfile(cache_path):
+            with zstandard.open(cache_path, mode="rb") as file:
+                return pickle.load(file)  # noqa: S301
+
+    ph_docs = dict(
+        iter_pymatgen_phonon_docs(paths, verbose=verbose, n_workers=n_workers)
+    )
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        # low zstd level since the cache is written once per change of the docs but
+        # should be much smaller than the raw pickle (mostly float arrays)
+        cctx = zstandard.ZstdCompressor(level=3)
+        with zstandard.open(cache_path, mode="wb", cctx=cctx) as file:
+            pickle.dump(ph_docs, file, protocol=pickle.HIGHEST_PROTOCOL)
 
     return ph_docs
 
 
+def _ph_doc_load_rank(path: str) -> int:
+    """Rank phonon doc formats by load speed (lower is faster): msgpack.zst <
+    json.zst < json.gz < json.lzma. Unknown extensions rank last.
+    """
+    fastest_first = (".msgpack.zst", ".json.zst", ".json.gz", ".json.lzma")
+    return next(
+        (idx for idx, ext in enumerate(fastest_first) if path.endswith(ext)),
+        len(fastest_first),
+    )
+
+
+def _parse_ph_doc_path(path: str) -> tuple[str, str]:
+    """Get the MP ID and model name from a phonon doc file path.
+
+    Args:
+        path (str): Path to a phonon doc like ".../mp-149-Si2-mace-mp-0.json.lzma".
+
+    Raises:
+        ValueError: If the file name doesn't match PH_DOC_PATH_RE.
+
+    Returns:
+        tuple[str, str]: MP ID and model name.
+    """
+    if match := PH_DOC_PATH_RE.match(os.path.basename(path)):
+        return match[1], match[3]
+    raise ValueError(
+        f"Can't parse MP ID and model from {path=}, should match "
+        f"{PH_DOC_PATH_RE.pattern!r}"
+    )
+
+
 def get_df_summary(
     ph_docs: PhDocs | DB = DB.phonon_db,
     *,  # force keyword-only arguments
@@ -137,35 +491,43 @@ def get_df_summary(
             Defaults to 0.1. See pymatgen's PhononBandStructureSymmLine
             has_imaginary_freq() method.
         cache_path (str | Path): Path to cache file. Set to None to disable caching.
-            Default = f"{DATA_DIR}/{ph_docs}/df-summary-tol={imaginary_freq_tol}.csv.gz"
+            Written as Parquet if the path ends in .parquet, else as CSV. Default =
+            f"{DATA_DIR}/{ph_docs}/df-summary-tol={imaginary_freq_tol}.parquet". If
+            that file doesn't exist yet, a legacy .csv.gz cache is read instead.
         refresh_cache (bool | str): If True, reload all phonon docs in given database
             directory. Will write a new summary CSV after. If a string, use as a
             glob pattern to only reload matching files for speed. Has no effect when
             ph_docs is a list of documents and not a str (as in a database name) other
-            than writing a new CSV cache file. Defaults to False.
+            than writing a new cache file. Defaults to False.
 
     Returns:
         pd.DataFrame: Summary metrics for each material and model in ph_docs.
     """
     from ffonons import DATA_DIR
 
+    read_path = cache_path
     if isinstance(ph_docs, str) and cache_path is not None:
-        cache_path = (
-            cache_path
-            or f"{DATA_DIR}/{ph_docs}/df-summary-tol={imaginary_freq_tol}.csv.gz"
-        )
+        cache_stem = f"{DATA_DIR}/{ph_docs}/df-summary-tol={imaginary_freq_tol}"
+        cache_path = read_path = cache_path or f"{cache_stem}.parquet"
+        if not os.path.isfile(cache_path) and os.path.isfile(f"{cache_stem}.csv.gz"):
+            # migrate legacy CSV cache to Parquet on next write
+            read_path = f"{cache_stem}.csv.gz"
 
     df_cached = None
-    if os.path.isfile(cache_path or ""):
-        df_cached = pd.read_csv(
-            cache_path, index_col=[Key.mat_id, Key.model]
-        ).convert_dtypes()
+    if os.path.isfile(read_path or ""):
+        if str(read_path).endswith(".parquet"):
+            # Parquet round-trips dtypes and the MultiIndex so no convert_dtypes()
+            df_cached = pd.read_parquet(read_path)
+        else:
+            df_cached = pd.read_csv(
+                read_path, index_col=[Key.mat_id, Key.model]
+            ).convert_dtypes()
         if not refresh_cache:
             n_days = (
                 datetime.now(tz=UTC)
-                - datetime.fromtimestamp(os.path.getmtime(cache_path), tz=UTC)
+                - datetime.fromtimestamp(os.path.getmtime(read_path), tz=UTC)
             ).days
-            print(f"Using cached df_summary from {cache_path!r} (days old: {n_days}). ")
+            print(f"Using cached df_summary from {read_path!r} (days old: {n_days}). ")
             return df_cached
 
     if (
@@ -173,15 +535,14 @@ def get_df_summary(
         and refresh_cache == "incremental"
         and isinstance(df_cached, pd.DataFrame)
     ):
-        all_files = glob(f"{DATA_DIR}/{ph_docs}/*.json.gz") + glob(
-            f"{DATA_DIR}/{ph_docs}/*.json.lzma"
-        )
+        all_files = glob_ph_docs(f"{DATA_DIR}/{ph_docs}")
 
-        loaded_mat_id_model_combos = tuple(df_cached.index)
+        # hash set for O(1) membership tests (a tuple is scanned linearly per path)
+        loaded_mat_id_model_combos = frozenset(df_cached.index)
 
         def id_model_combo_already_loaded(path: str) -> bool:
-            mat_id, _formula, model = re.search(
-                r".*/(mp-\d+)-([A-Z][^-]+)-(.*).json.*", path
+            mat_id, _formula, model = PH_DOC_PATH_RE.match(
+                os.path.basename(path)
             ).groups()
             return (mat_id, model) in loaded_mat_id_model_combos
 
@@ -190,19 +551,33 @@ def get_df_summary(
         ]
         ph_docs = files_to_load
 
-    glob_patt = refresh_cache if isinstance(refresh_cache, str) else ""
-    loaded_docs = load_pymatgen_phonon_docs(docs_to_load=ph_docs, glob_patt=glob_patt)
+    if isinstance(ph_docs, dict):
+        mat_docs_iter = ph_docs.items()
+    else:
+        # stream docs one material at a time so each material's docs can be garbage
+        # collected as soon as its summary rows are computed
+        glob_patt = (
+            refresh_cache
+            if isinstance(refresh_cache, str) and refresh_cache != "incremental"
+            else ""
+        )
+        mat_docs_iter = iter_pymatgen_phonon_docs(ph_docs, glob_patt=glob_patt)
 
-    summary_dict: dict[tuple[str, str], dict] = defaultdict(dict)
-    for mat_id, docs in loaded_docs.items():  # iterate over materials
+    idx_names = [str(Key.mat_id), str(Key.model)]
+    # collect one flat dict per (material, model) row. much cheaper for pandas than
+    # a dict of dicts that has to be transposed
+    rows: list[dict[str, Any]] = []
+    for mat_id, docs in mat_docs_iter:  # iterate over materials
+        # PBE DOS is the reference for DOS MAE and R2 of all ML models of a material
+        pbe_dos = docs[Key.pbe].phonon_dos if Key.pbe in docs else None
         for model, ph_doc in docs.items():  # iterate over models for each material
             if df_cached is not None and (mat_id, model) in df_cached.index:
                 # Skip if this entry already exists in the cache
                 continue
 
-            id_model = mat_id, model
-            summary_dict[id_model][Key.formula] = ph_doc.structure.formula
-            summary_dict[id_model][Key.n_sites] = len(ph_doc.structure)
+            row: dict[str, Any] = {str(Key.mat_id): mat_id, str(Key.model): model}
+            row[Key.formula] = ph_doc.structure.formula
+            row[Key.n_sites] = len(ph_doc.structure)
             supercell = getattr(
                 ph_doc, "supercell", getattr(ph_doc, "supercell_matrix", None)
             )
@@ -213,38 +588,44 @@ def get_df_summary(
                 and supercell.trace() != supercell.sum()
             ):
                 raise ValueError(f"Non-diagonal {supercell=}")
-            summary_dict[id_model][Key.supercell] = ", ".join(
-                map(str, np.diag(supercell))
-            )
+            row[Key.supercell] = ", ".join(map(str, np.diag(supercell)))
 
             # last phonon DOS peak
             ph_dos = ph_doc.phonon_dos
             last_peak = ph_dos.get_last_peak()
-            summary_dict[id_model][Key.last_ph_dos_peak] = last_peak
+            row[Key.last_ph_dos_peak] = last_peak
 
             # min/max frequency from band structure
             ph_bs = ph_doc.phonon_bandstructure
-            summary_dict[id_model][Key.max_ph_freq] = ph_bs.bands.max()
-            summary_dict[id_model][Key.min_ph_freq] = ph_bs.bands.min()
-
-            if model != Key.pbe and Key.pbe in docs:  # calculate DOS MAE and R2
-                pbe_dos = docs[Key.pbe].phonon_dos
-                summary_dict[id_model][Key.ph_dos_mae] = ph_dos.mae(pbe_dos)
-                summary_dict[id_model][PhKey.ph_dos_r2] = ph_dos.r2_score(pbe_dos)
-
-            # has imaginary modes
-            has_imag_modes = ph_bs.has_imaginary_freq(tol=imaginary_freq_tol)
-            summary_dict[id_model][Key.has_imag_ph_modes] = has_imag_modes
-            has_imag_gamma_mode = ph_bs.has_imaginary_gamma_freq(tol=imaginary_freq_tol)
-            summary_dict[id_model][Key.has_imag_ph_gamma_modes] = has_imag_gamma_mode
-
-    # convert_dtypes() turns boolean cols imaginary_(gamma_)freq to bool
-    new_df = pd.DataFrame(summary_dict).T.convert_dtypes()
-    idx_names = [str(Key.mat_id), str(Key.model)]
-    if len(new_df.index.names) == len(idx_names):
-        new_df.index.names = idx_names
-    elif len(new_df.index.names) == 1:
-        new_df.index.names = [idx_names[0]]
+            bands = ph_bs.bands  # shape (n_branches, n_qpoints)
+            min_freq = bands.min()
+            row[Key.max_ph_freq] = bands.max()
+            row[Key.min_ph_freq] = min_freq
+
+            if model != Key.pbe and pbe_dos is not None:  # calculate DOS MAE and R2
+                row[Key.ph_dos_mae] = ph_dos.mae(pbe_dos)
+                row[PhKey.ph_dos_r2] = ph_dos.r2_score(pbe_dos)
+
+            # has imaginary modes (anywhere or at Gamma). same checks as pymatgen's
+            # has_imaginary_(gamma_)freq() but reusing min_freq and only looking at
+            # Gamma columns instead of re-scanning the bands array once per method
+            has_imag_modes = bool(min_freq < -imaginary_freq_tol)
+            row[Key.has_imag_ph_modes] = has_imag_modes
+            q_frac_coords = np.array([q_pt.frac_coords for q_pt in ph_bs.qpoints])
+            is_gamma = np.isclose(q_frac_coords, 0).all(axis=1)
+            has_imag_gamma_mode = bool((bands[:, is_gamma] < -imaginary_freq_tol).any())
+            row[Key.has_imag_ph_gamma_modes] = has_imag_gamma_mode
+            rows += [row]
+
+    # cast to known nullable dtypes directly instead of letting convert_dtypes()
+    # infer them column by column. DOS MAE/R2 cols are missing if no ML docs loaded
+    if rows:
+        new_df = pd.DataFrame.from_records(rows).set_index(idx_names)
+        new_df = new_df.astype(
+            {col: dtype for col, dtype in SUMMARY_DTYPES.items() if col in new_df}
+        )
+    else:  # all docs already cached
+        new_df = pd.DataFrame(index=pd.MultiIndex.from_tuples([], names=idx_names))
 
     # Concatenate the existing DataFrame with the new one
 
@@ -257,17 +638,27 @@ def get_df_summary(
         )
         df_summary = df_cached
 
-    if cache_path:
+    if cache_path and str(cache_path).endswith(".parquet"):
+        df_summary.to_parquet(cache_path)
+    elif cache_path:
         df_summary.to_csv(cache_path)
 
     return df_summary
 
 
+def _parse_cif(cif_str: str) -> Structure:
+    """Parse a CIF string into a pymatgen Structure. Module-level function so it can
+    be pickled for process pools.
+    """
+    return Structure.from_str(cif_str, "cif")
+
+
 def get_gnome_pmg_structures(
     zip_path: str = "",
     ids: int | Sequence[str] = 10,
     pbar_desc: str = "Loading GNoME structures",
     pbar_disable: bool | int = 100,
+    n_workers: int = 1,
 ) -> dict[str, Structure]:
     """Load structures from GNoME ZIP file.
 
@@ -280,6 +671,9 @@ def get_gnome_pmg_structures(
             structures".
         pbar_disable (bool | int): Disable progress bar if True or if number of
             structures is less than this value. Defaults to 100.
+        n_workers (int): Number of processes to parse CIFs in parallel. CIF parsing
+            is pure-Python and CPU-bound so this helps for thousands of structures.
+            Defaults to 1 (no pool).
 
     Returns:
         dict[str, Structure]: dict of structures with material ID as key
@@ -288,33 +682,49 @@ def get_gnome_pmg_structures(
 
     zip_path = zip_path or f"{DATA_DIR}/gnome/stable-cifs-by-id.zip"
 
-    structs: dict[str, Structure] = {}
+    # reading from the ZIP is cheap, so do it up front in the main process
+    cif_strs: dict[str, str] = {}
     with ZipFile(zip_path) as zip_ref:
         if isinstance(ids, int):
-            file_list = zip_ref.namelist()[:ids]
+            # first n CIFs, skipping directory and other non-CIF entries lazily so
+            # they don't count towards n
+            cif_names = (name for name in zip_ref.namelist() if name.endswith(".CIF"))
+            file_list = list(islice(cif_names, ids))
         elif isinstance(ids, Sequence):
             file_list = [f"by_id/{mp_id}.CIF" for mp_id in ids]
         else:
             raise TypeError(f"Invalid {ids=}")
 
-        if isinstance(pbar_disable, int):
-            pbar_disable = len(file_list) < pbar_disable
+        for filename in file_list:
+            mat_id = filename.split("/")[-1].split(".")[0]
+            cif_strs[mat_id] = zip_ref.read(filename).decode()
 
-        for filename in tqdm(file_list, desc=pbar_desc, disable=pbar_disable):
-            if filename.endswith(".CIF"):
-                mat_id = filename.split("/")[-1].split(".")[0]
-                with zip_ref.open(filename) as file:
-                    struct = Structure.from_str(file.read().decode(), "cif")
+    if isinstance(pbar_disable, int):
+        pbar_disable = len(cif_strs) < pbar_disable
 
-                struct.properties[Key.mat_id] = mat_id
-                structs[mat_id] = struct
+    structs: dict[str, Structure] = {}
+    pool = _fork_pool(n_workers) if n_workers > 1 else nullcontext()
+    with pool as executor:
+        if executor is None:
+            parsed_structs = map(_parse_cif, cif_strs.values())
+        else:
+            parsed_structs = executor.map(_parse_cif, cif_strs.values(), chunksize=8)
+        pbar = tqdm(
+            zip(cif_strs, parsed_structs, strict=True),
+            total=len(cif_strs),
+            desc=pbar_desc,
+            disable=pbar_disable,
+        )
+        for mat_id, struct in pbar:
+            struct.properties[Key.mat_id] = mat_id
+            structs[mat_id] = struct
 
     return structs
 
 
 def update_key_name(directory: str, key_map: dict[str, str]) -> None:
     """Load all phonon docs in a directory and update the name of a key, then save
-    updated doc back to disk.
+    updated doc back to disk. Docs without any of the old keys are not rewritten.
 
     Args:
         directory (str): Path to the directory containing the phonon docs.
@@ -323,19 +733,75 @@ def update_key_name(directory: str, key_map: dict[str, str]) -> None:
     Example:
         update_key_name(f"{DATA_DIR}/{which_db}/", {"supercell_matrix": "supercell"})
     """
-    paths = glob(f"{directory}/*.json.gz") + glob(f"{directory}/*.json.lzma")
+    paths = glob_ph_docs(directory)
+    # quoted old keys as they appear in JSON docs. if none of them occur in the raw
+    # bytes, the doc can't have such a key and we skip parsing it
+    old_keys_json = [orjson.dumps(old_key) for old_key in key_map]
 
     for path in tqdm(paths, desc="Updating key name"):
         try:
-            with zopen(path, mode="rt") as file:
-                ph_doc: PhononBSDOSDoc | PhononDBDocParsed = json.load(file)
+            if path.endswith(".msgpack.zst"):
+                ph_doc: dict[str, Any] = load_ph_doc(path, decode=False)
+            else:
+                with open_ph_doc(path, mode="rb") as file:
+                    json_bytes = file.read()
+                if not any(old_key in json_bytes for old_key in old_keys_json):
+                    continue
+                ph_doc = _json_loads(json_bytes)
         except Exception as exc:
             print(f"Error loading {path=}: {exc}")
             continue
 
-        for old_key, new_key in key_map.items():
-            if old_key in ph_doc:
-                ph_doc[new_key] = ph_doc.pop(old_key)
+        old_keys = [old_key for old_key in key_map if old_key in ph_doc]
+        for old_key in old_keys:
+            ph_doc[key_map[old_key]] = ph_doc.pop(old_key)
 
-        with zopen(path, mode="wt") as file:
-            json.dump(ph_doc, file)
+        # only recompress docs that changed, compression is the slowest step
+        if old_keys:
+            dump_ph_doc(ph_doc, path)
+
+
+def migrate_to_zstd(
+    directory: str,
+    *,
+    fmt: Literal["json", "msgpack"] = "json",
+    remove_old: bool = False,
+) -> list[str]:
+    """Recompress all .json.gz and .json.lzma phonon docs in a directory with
+    Zstandard which decompresses several times faster. Docs that already have a
+    sibling in the target format are skipped.
+
+    Args:
+        directory (str): Path to the directory containing the phonon docs.
+        fmt ("json" | "msgpack"): Target format. "json" writes .json.zst files by
+            recompressing the raw JSON bytes without parsing them. "msgpack" writes
+            .msgpack.zst files (also converting .json.zst docs) which store floats as
+            binary instead of decimal text and deserialize several times faster.
+            Defaults to "json".
+        remove_old (bool): Whether to delete the old files after successful
+            migration. Defaults to False.
+
+    Returns:
+        list[str]: Paths of newly written .zst files.
+    """
+    old_exts = (".json.gz", ".json.lzma") + ((".json.zst",) if fmt == "msgpack" else ())
+    new_ext = f".{fmt}.zst"
+    new_paths = []
+    old_paths = [path for ext in old_exts for path in glob(f"{directory}/*{ext}")]
+
+    for old_path in tqdm(old_paths, desc=f"Migrating to {new_ext}"):
+        new_path = old_path.rsplit(".", 2)[0] + new_ext
+        if not os.path.isfile(new_path):
+            if fmt == "msgpack":
+                dump_ph_doc(load_ph_doc(old_path, decode=False), new_path)
+            else:
+                with open_ph_doc(old_path, mode="rb") as file:
+                    json_bytes = file.read()
+                with open_ph_doc(new_path, mode="wb") as file:
+                    file.write(json_bytes)
+            new_paths += [new_path]
+
+        if remove_old:
+            os.remove(old_path)
+
+    return new_paths
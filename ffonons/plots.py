@@ -4,11 +4,14 @@ interactive and more customizable band structure and DOS plotting functions in p
 
 import re
 import sys
+from typing import Any
 
+import numpy as np
 import plotly.express as px
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection
 from pymatgen.core import Structure
-from pymatgen.phonon import PhononDos, PhononDosPlotter
+from pymatgen.phonon import PhononBandStructureSymmLine, PhononDos, PhononDosPlotter
 from pymatgen.util.string import htmlify, latexify
 
 from ffonons.enums import DB, Model, PhKey
@@ -99,6 +102,72 @@ def plot_phonon_dos_mpl(
     return ax
 
 
+def plot_phonon_bands_mpl(
+    band_structs: PhononBandStructureSymmLine | dict[str, PhononBandStructureSymmLine],
+    ax: plt.Axes | None = None,
+    line_kwargs: dict[str, dict[str, Any]] | None = None,
+) -> plt.Axes:
+    """Plot one or more phonon band structures with matplotlib.
+
+    All bands of a band structure are drawn as a single LineCollection instead of one
+    ax.plot() call per band and branch as in pymatgen's PhononBSPlotter, which makes
+    this much faster for structures with many bands.
+
+    Args:
+        band_structs (PhononBandStructureSymmLine | dict[str, ...]): Single band
+            structure or dict of band structures with plot labels as keys.
+        ax (plt.Axes | None = None): Matplotlib axes to plot on. If None, plot on the
+            current axes.
+        line_kwargs (dict[str, dict[str, Any]] | None = None): LineCollection keyword
+            arguments (e.g. linestyles, linewidths, colors) keyed by band structure
+            label. Colors default to the matplotlib color cycle.
+
+    Returns:
+        plt.Axes: Matplotlib axes
+    """
+    ax = ax or plt.gca()
+    if not isinstance(band_structs, dict):
+        band_structs = {"": band_structs}
+    line_kwargs = line_kwargs or {}
+
+    x_ticks: dict[float, str] = {}
+    for idx, (label, band_struct) in enumerate(band_structs.items()):
+        distances = np.asarray(band_struct.distance)
+        bands = np.asarray(band_struct.bands)  # shape (n_bands, n_qpoints)
+
+        # one polyline per band and branch so no lines are drawn across the jumps
+        # between disconnected branches (e.g. at X|U)
+        segments: list[np.ndarray] = []
+        for branch in band_struct.branches:
+            q_slice = slice(branch["start_index"], branch["end_index"] + 1)
+            ys = bands[:, q_slice]
+            xs = np.broadcast_to(distances[q_slice], ys.shape)
+            segments += list(np.stack((xs, ys), axis=-1))
+
+        kwargs = dict(colors=f"C{idx}", label=label) | line_kwargs.get(label, {})
+        ax.add_collection(LineCollection(segments, **kwargs))
+
+        for qpoint, dist in zip(band_struct.qpoints, distances, strict=True):
+            if q_label := qpoint.label:
+                q_label = "Γ" if q_label.upper() in ("GAMMA", "\\GAMMA") else q_label
+                prev_label = x_ticks.get(dist)
+                if prev_label and q_label not in prev_label.split("|"):
+                    q_label = f"{prev_label}|{q_label}"
+                x_ticks[dist] = q_label
+
+    ax.autoscale_view()
+    ax.set_xlim(min(x_ticks, default=None), max(x_ticks, default=None))
+    ax.set_xticks(list(x_ticks), list(x_ticks.values()))
+    for x_tick in x_ticks:
+        ax.axvline(x_tick, color="gray", linewidth=0.5, zorder=0)
+    ax.axhline(0, color="black", linewidth=0.5, zorder=0)
+    ax.set(xlabel="Wave Vector", ylabel="Frequency (THz)")
+    if any(band_structs):  # only add legend if band structures have labels
+        ax.legend()
+
+    return ax
+
+
 def plotly_title(formula: str, href: str = "") -> str:
     """Make plotly figure title from HTML-ified formula and link to MP details page
     (legacy since only legacy has phonons) or other URL.
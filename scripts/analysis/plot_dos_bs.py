@@ -0,0 +1,296 @@
+"""Plot phonon DOS and band structure comparing DFT with different ML models.
+
+Matplotlib plots use the ffonons.plots functions, Plotly plots use pymatviz. Call
+render_all() with the database and plot types to render, e.g.
+render_all(DB.phonon_db, which="bands_plotly").
+"""
+
+# %%
+import os
+import sys
+from collections.abc import Sequence
+from typing import Literal, get_args
+
+import matplotlib as mpl
+import pandas as pd
+import plotly.io as pio
+import pymatviz as pmv
+from matplotlib import pyplot as plt
+from pymatgen.util.string import latexify
+from pymatviz.enums import Key
+from tqdm import tqdm
+
+import ffonons
+from ffonons import PDF_FIGS, SITE_FIGS
+from ffonons.enums import DB, Model
+from ffonons.io import PhDocs
+from ffonons.plots import (
+    plot_phonon_bands_mpl,
+    plot_phonon_dos_mpl,
+    plotly_title,
+    pretty_labels,
+)
+
+__author__ = "Janosh Riebesell"
+__date__ = "2023-11-24"
+
+# when run as a batch job (python plot_dos_bs.py), figures are only written to
+# disk, so use the non-interactive Agg backend. Jupyter/VS Code interactive sessions
+# (which run on ipykernel) keep their inline backend.
+if "ipykernel" not in sys.modules:
+    mpl.use("Agg")
+
+# serialize plotly figures (incl. numpy arrays of band frequencies) with orjson in C
+# instead of plotly's default pure-Python JSON encoder when exporting them
+pio.json.config.default_engine = "orjson"
+
+PlotType = Literal["dos_mpl", "bands_mpl", "bands_plotly", "bs_dos_plotly"]
+plot_types: tuple[PlotType, ...] = get_args(PlotType)
+
+
+# %%
+def get_idx_n_avail(df_summary: pd.DataFrame, max_n: int = 5) -> dict[int, pd.Index]:
+    """Get material IDs with results from at least 1, 2, ..., max_n models.
+
+    Args:
+        df_summary (pd.DataFrame): Summary with (material ID, model) multi-index.
+        max_n (int): Largest number of models (incl. DFT) to count. Defaults to 5.
+
+    Returns:
+        dict[int, pd.Index]: Map from minimum number of models (incl. DFT) to IDs of
+            materials with results from at least that many models.
+    """
+    # count models (incl. DFT) with results for each material once, then threshold
+    n_models_per_mat = df_summary[Key.max_ph_freq].unstack().notna().sum(axis=1)
+    idx_n_avail: dict[int, pd.Index] = {}
+
+    for idx in range(1, max_n + 1):
+        idx_n_avail[idx] = n_models_per_mat.index[n_models_per_mat >= idx]
+        n_avail = len(idx_n_avail[idx])
+        print(f"{n_avail:,} materials with results from {idx}+ models (incl. DFT)")
+
+    return idx_n_avail
+
+
+def render_dos_mpl(ph_docs: PhDocs, mp_ids: Sequence[str], model: Model) -> None:
+    """Plot PBE vs ML phonon DOS for each material with matplotlib."""
+    # reuse one figure for all materials and only clear the axes between saves
+    fig_dos, ax_dos = plt.subplots(figsize=(12, 8))
+
+    for mp_id in mp_ids:
+        if not {Key.pbe, model} <= ph_docs[mp_id].keys():
+            continue  # need both PBE and model results to compare
+        ml_doc, pbe_doc = ph_docs[mp_id][model], ph_docs[mp_id][Key.pbe]
+        formula = ml_doc.structure.formula
+
+        doses = {
+            model.label: ml_doc.phonon_dos,
+            Key.pbe.label: pbe_doc.phonon_dos,
+        }
+        plot_phonon_dos_mpl(doses, ax=ax_dos, last_peak_anno=r"${key}={last_peak:.1f}$")
+        ax_dos.set_title(
+            f"{mp_id} {latexify(formula, bold=True)}", fontsize=22, fontweight="bold"
+        )
+        pmv.save_fig(
+            fig_dos, f"{PDF_FIGS}/{mp_id}-{formula.replace(' ', '')}/dos-all.pdf"
+        )
+        ax_dos.clear()
+
+    plt.close(fig_dos)  # pyplot keeps figures alive until closed
+
+
+def render_bands_mpl(
+    ph_docs: PhDocs, mp_ids: Sequence[str], model: Model, figs_dir: str
+) -> None:
+    """Plot PBE vs ML phonon band structures for each material with matplotlib."""
+    fig_bands, ax_bands = plt.subplots(figsize=(12, 8))
+    fig_bands.subplots_adjust(top=0.95)  # make room for title
+
+    for mp_id in tqdm(mp_ids):
+        if not {Key.pbe, model} <= ph_docs[mp_id].keys():
+            continue  # need both PBE and model results to compare
+        pbe_bands = ph_docs[mp_id][Key.pbe].phonon_bandstructure
+        ml_bands = ph_docs[mp_id][model].phonon_bandstructure
+
+        formula = ph_docs[mp_id][model].structure.formula
+        plot_phonon_bands_mpl(
+            {Key.pbe.label: pbe_bands, model.label: ml_bands},
+            ax=ax_bands,
+            line_kwargs={
+                Key.pbe.label: dict(linewidths=2),
+                model.label: dict(linewidths=2, linestyles="dashed"),
+            },
+        )
+        ax_bands.set_title(f"{latexify(formula)} {mp_id}", fontsize=24)
+        pmv.save_fig(fig_bands, f"{figs_dir}/{mp_id}-bands-pbe-vs-{model}.pdf")
+        ax_bands.clear()
+
+    plt.close(fig_bands)  # pyplot keeps figures alive until closed
+
+
+def render_bands_plotly(
+    ph_docs: PhDocs, mp_ids: Sequence[str], model: Model, figs_dir: str
+) -> None:
+    """Plot PBE vs ML phonon band structures for each material with plotly."""
+    for mp_id in tqdm(mp_ids):
+        if not {Key.pbe, model} <= ph_docs[mp_id].keys():
+            continue  # need both PBE and model results to compare
+        out_path = f"{figs_dir}/{mp_id}-bands-pbe-vs-{model}.pdf"
+        if os.path.isfile(out_path):
+            continue
+        bs_pbe = ph_docs[mp_id][Key.pbe].phonon_bandstructure
+        bs_ml = ph_docs[mp_id][model].phonon_bandstructure
+
+        band_structs = {Key.pbe.label: bs_pbe, model.label: bs_ml}
+        try:
+            fig_bs = pmv.phonon_bands(band_structs, line_kwds=dict(width=1.5))
+        except ValueError as exc:
+            print(f"{mp_id=} {exc=}")
+            continue
+
+        formula = ph_docs[mp_id][Key.pbe].structure.formula
+        title = plotly_title(formula, mp_id)
+        fig_bs.layout.title = dict(text=title, x=0.5, y=0.96)
+        fig_bs.layout.margin = dict(t=65, b=0, l=5, r=5)
+
+        pmv.save_fig(fig_bs, out_path, prec=5)
+
+
+def render_bs_dos_plotly(ph_docs: PhDocs, mp_ids: Sequence[str], figs_dir: str) -> None:
+    """Plot band structures and DOS of all models side by side with plotly."""
+    color_map = {
+        model.label: {"line_color": clr}
+        for model, clr in (
+            (Key.pbe, "red"),
+            (Model.mace_mp, "green"),
+            (Model.chgnet_030, "orange"),
+            (Model.m3gnet_ms, "blue"),
+        )
+    }
+    legend_labels = {
+        "PBE": "DFT",
+        Model.mace_mp.label: "MACE",
+        Model.chgnet_030.label: "CHGNet",
+        Model.m3gnet_ms.label: "M3GNet",
+    }
+
+    for mp_id in tqdm(mp_ids):
+        ph_doc = ph_docs[mp_id]
+        keys = sorted(ph_doc, reverse=True)
+        bands_dict = {
+            pretty_labels.get(key, key): ph_doc[key].phonon_bandstructure
+            for key in keys
+        }
+        dos_dict = {pretty_labels.get(key, key): ph_doc[key].phonon_dos for key in keys}
+        img_name = f"{mp_id}-bs-dos-{'-vs-'.join(keys)}"
+        try:
+            fig_bs_dos = pmv.phonon_bands_and_dos(
+                bands_dict,
+                dos_dict,
+                all_line_kwargs=dict(line_width=2),
+                per_line_kwargs=color_map,
+                bands_kwargs={
+                    # "branches": ("GAMMA-Z", "Z-D", "D-B", "B-GAMMA"),
+                    # "branch_mode": "intersect",
+                },
+            )
+        except ValueError as exc:
+            print(f"{mp_id=} {exc=}")
+            continue
+
+        for trace in fig_bs_dos.data:  # remap legend labels
+            trace.name = legend_labels.get(trace.name, trace.name)
+
+        # formula = next(iter(ph_doc.values())).structure.formula
+        # fig_bs_dos.layout.title = dict(text=plotly_title(formula, mp_id), x=0.5)
+        fig_bs_dos.layout.margin = dict(t=5, b=0, l=5, r=5)
+        legend = dict(
+            x=0.5,
+            y=1.1,
+            xanchor="center",
+            itemsizing="constant",
+            bgcolor="rgba(0,0,0,0)",
+        )
+        fig_bs_dos.layout.legend.update(**legend)
+
+        height = 400
+        pmv.save_fig(
+            fig_bs_dos,
+            f"{figs_dir}/{img_name}.pdf",
+            prec=4,
+            height=height,
+            width=1.3 * height,
+        )
+        fig_bs_dos.layout.update(
+            template="pymatviz_dark", paper_bgcolor="rgba(0,0,0,0)"
+        )
+        pmv.save_fig(fig_bs_dos, f"{SITE_FIGS}/{img_name}.svelte", prec=4)
+
+
+def render_all(
+    db: DB,
+    min_preds: int = 2,
+    which: PlotType | Sequence[PlotType] | Literal["all"] = "all",
+    model: Model = Model.mace_mp,
+) -> None:
+    """Load summary and phonon docs for a database once and render the requested
+    DOS/band structure plots for all materials with enough model predictions.
+
+    Args:
+        db (DB): Database whose phonon docs to plot.
+        min_preds (int): Minimum number of models (incl. DFT) with results for a
+            material to be plotted. Defaults to 2.
+        which (PlotType | Sequence[PlotType] | "all"): Plot type(s) to render.
+            Defaults to "all".
+        model (Model): ML model to compare against PBE in the DOS and band structure
+            plots. Defaults to Model.mace_mp.
+    """
+    which = plot_types if which == "all" else which
+    which = {which} if isinstance(which, str) else {*which}
+    if unknown := which - {*plot_types}:
+        raise ValueError(f"Unknown plot types {unknown}, must be in {plot_types}")
+
+    df_summary = ffonons.io.get_df_summary(db)
+    mp_ids = get_idx_n_avail(df_summary, max_n=min_preds)[min_preds]
+
+    os.makedirs(figs_dir := f"{PDF_FIGS}/{db}", exist_ok=True)
+
+    ph_docs = ffonons.io.load_pymatgen_phonon_docs(db, materials_ids=list(mp_ids))
+    mp_ids = [mp_id for mp_id in mp_ids if mp_id in ph_docs]
+
+    if "dos_mpl" in which:
+        render_dos_mpl(ph_docs, mp_ids, model)
+    if "bands_mpl" in which:
+        render_bands_mpl(ph_docs, mp_ids, model, figs_dir)
+    if "bands_plotly" in which:
+        render_bands_plotly(ph_docs, mp_ids, model, figs_dir)
+    if "bs_dos_plotly" in which:
+        render_bs_dos_plotly(ph_docs, mp_ids, figs_dir)
+
+
+# %% get material with n_sites < 10 and most underpredicted max freq
+df_summary = ffonons.io.get_df_summary(DB.phonon_db)
+idx_n_avail = get_idx_n_avail(df_summary)
+
+# get index sorted by most underpredicted max freq according to CHGNet compared to DFT
+most_underpred = (
+    df_summary[Key.max_ph_freq].xs(Model.chgnet_030, level=1)
+    - df_summary[Key.max_ph_freq].xs(Key.pbe, level=1)
+).sort_values()
+
+# get intersection with materials with less than 10 sites
+most_underpred = most_underpred.index.intersection(idx_n_avail[3])
+
+df_summary.loc[most_underpred].loc[most_underpred].query(f"{Key.n_sites} < 6")
+
+
+# %% matplotlib DOS and bands comparing PBE with MACE
+render_all(DB.one_off, which=("dos_mpl", "bands_mpl"), model=Model.mace_mp)
+
+
+# %% plotly bands comparing PBE with M3GNet
+render_all(DB.phonon_db, which="bands_plotly", model=Model.m3gnet_ms)
+
+
+# %% plotly bands+DOS for materials with all 4 models available
+render_all(DB.phonon_db, min_preds=4, which="bs_dos_plotly")
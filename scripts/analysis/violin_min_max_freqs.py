@@ -23,22 +23,29 @@ df_summary = ffonons.io.get_df_summary(which_db := DB.phonon_db)
 os.makedirs(FIG_DIR := f"{PDF_FIGS}/{which_db}", exist_ok=True)
 os.makedirs(FIG_DIR := SOFT_PES_DIR, exist_ok=True)
 
+# LabelEnum rebuilds these dicts from its members on every call, so build them once
+model_labels = Model.val_label_dict()
+model_colors = Model.label_desc_dict()  # desc holds the model's plot color
+
 df_ph_freq = df_summary[Key.max_ph_freq].unstack().dropna()
 
 # compute diff or ratio of ML and DFT max phonon frequencies
 df_ph_freq_ml_vs_pbe = df_ph_freq.div(df_ph_freq[Key.pbe], axis=0)
 
 df_ph_freq_ml_vs_pbe = df_ph_freq_ml_vs_pbe.drop(columns=Key.pbe)
-df_ph_freq_ml_vs_pbe = df_ph_freq_ml_vs_pbe.rename(columns=Model.val_label_dict())
+df_ph_freq_ml_vs_pbe = df_ph_freq_ml_vs_pbe.rename(columns=model_labels)
 
 models_in_asc_mean = df_ph_freq_ml_vs_pbe.mean().sort_values().index
 
+# short model names for x tick labels, e.g. "CHGNet v0.3.0" -> "CHGNet"
+short_names = {col: col.split(" ")[0].split("-")[0] for col in df_ph_freq_ml_vs_pbe}
+
 
 # %% matplotlib version for visual consistency with PES softening paper 2024-02-22
 ax = sns.violinplot(
     df_ph_freq_ml_vs_pbe[models_in_asc_mean],
     inner="box",
-    palette=Model.label_desc_dict(),
+    palette=model_colors,
     saturation=0.65,
     linewidth=0,
 )
@@ -59,16 +66,14 @@ for idx, col in enumerate(models_in_asc_mean):
     n_total = len(df_ph_freq_ml_vs_pbe)
     if n_total != n_soft + n_hard:
         raise ValueError(f"{n_total=} != {n_soft=} + {n_hard=}")
-    color = Model.label_desc_dict()[col]
+    color = model_colors[col]
     anno = f"{n_hard / n_total:.0%}\n\n\n\n\n\n\n\n{n_soft / n_total:.0%}"
     ax.text(idx - 0.2, 0.85, anno, ha="center", va="center", fontsize=18, color=color)
 
     # mean = df_max_freq_rel[col_name].mean()
     # ax.text(idx, 1.4, f"mean\n{mean:.2f}", ha="center", va="center", fontsize=14)
 
-ax.set_xticklabels(
-    [tick.get_text().split(" ")[0].split("-")[0] for tick in ax.get_xticklabels()]
-)
+ax.set_xticklabels([short_names[col] for col in models_in_asc_mean])
 
 y_range = 0.7
 y_label = r"$\Omega_{\text{max}}^{\text{ML}} \;/\; \Omega_{\text{max}}^{\text{DFT}}$"
@@ -90,7 +95,7 @@ for key, op in (
     df_ph_freq_ml_vs_pbe = getattr(df_ph_freq, op)(df_ph_freq[Key.pbe], axis=0)
 
     df_ph_freq_ml_vs_pbe = df_ph_freq_ml_vs_pbe.drop(columns=Key.pbe)
-    df_ph_freq_ml_vs_pbe = df_ph_freq_ml_vs_pbe.rename(columns=Model.val_label_dict())
+    df_ph_freq_ml_vs_pbe = df_ph_freq_ml_vs_pbe.rename(columns=model_labels)
 
     fig = go.Figure()
 
@@ -138,10 +143,10 @@ for key, op in (
     for idx, (col, ys) in enumerate(df_ph_freq_ml_vs_pbe.items()):
         fig.add_violin(
             y=ys,
-            name=col.split(" ")[0].split("-")[0],
+            name=short_names[col],
             box=dict(visible=True),
             showlegend=False,
-            marker_color=Model.label_desc_dict()[col],
+            marker_color=model_colors[col],
             width=1.3,
             side="positive",
             points=False,
@@ -160,7 +165,7 @@ for key, op in (
         n_low_err = ((ys > y0) & (ys < y1)).sum()
 
         n_total = len(df_ph_freq_ml_vs_pbe)
-        color = Model.label_desc_dict()[col]
+        color = model_colors[col]
         for val, y_pos in ((n_soft, y0), (n_hard, y1), (n_low_err, (y0 + y1) / 2)):
             yshift = {y0: -1, y1: 1}.get(y_pos, 0) * 20
             fig.add_annotation(
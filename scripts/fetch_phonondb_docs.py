@@ -2,23 +2,28 @@
 
 # %%
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from glob import glob
 from zipfile import BadZipFile
 
 import pandas as pd
+import requests
 from mp_api.client import MPRester
 from pymatviz.enums import Key
 from tqdm import tqdm
 
 from ffonons import DATA_DIR
 from ffonons.dbs.phonondb import (
+    download_files,
     fetch_togo_doc_by_id,
+    index_ph_docs,
     map_mp_to_togo_id,
     phonondb_doc_to_pmg_lzma,
     scrape_and_fetch_togo_docs_from_page,
 )
 from ffonons.enums import DB
+from ffonons.io import _fork_pool, glob_ph_docs
 
 __author__ = "Janine George, Aakash Nair, Janosh Riebesell"
 __date__ = "2023-12-07"
@@ -31,14 +36,37 @@ phonondb_base_url = "https://mdr.nims.go.jp/collections/8g84ms862"
 # %% get all phonon_db page urls
 urls = [f"{phonondb_base_url}?{page=}" for page in range(1, 1005)]
 
-dfs_fetched = []
-for url in tqdm(urls, desc="Downloading Togo Phonopy DB"):
-    dfs_fetched += [scrape_and_fetch_togo_docs_from_page(url, on_error="ignore")]
-
-
-# %%
-df_fetched = pd.concat(df for df in dfs_fetched if isinstance(df, pd.DataFrame))
-df_fetched = df_fetched.sort_index()
+# scraping is I/O-bound, so overlap network latency of different pages with threads.
+# first only collect download URLs from all index pages, then batch-download the zips
+# concurrently (rate-limited to not hammer the NIMS server)
+with ThreadPoolExecutor(max_workers=8) as executor:
+    scrape_page = partial(
+        scrape_and_fetch_togo_docs_from_page, on_error="ignore", download=False
+    )
+    pages_fetched = list(
+        tqdm(
+            executor.map(scrape_page, urls),
+            total=len(urls),
+            desc="Scraping Togo Phonopy DB",
+        )
+    )
+
+
+# %% build a single DataFrame from all pages. failed pages return error messages
+# (which include the page URL) instead of rows
+failed_pages = [page for page in pages_fetched if isinstance(page, str)]
+if failed_pages:
+    print(f"{len(failed_pages):,} / {len(urls):,} pages failed, first few errors:")
+    print("\n".join(failed_pages[:5]))
+rows = [row for page in pages_fetched if isinstance(page, list) for row in page]
+# explicit columns so an empty rows list (e.g. all pages failed) doesn't KeyError
+df_fetched = pd.DataFrame(rows, columns=["mp_id", "doc_id", "url", "out_path"])
+df_fetched = df_fetched.set_index("mp_id").sort_index()
+
+zip_paths = download_files(
+    list(zip(df_fetched["url"], df_fetched["out_path"], strict=True))
+)
+print(f"downloaded {len(zip_paths):,} / {len(df_fetched):,} PhononDB zips")
 
 
 # %% 5 Togo materials with single site: mp-39, mp-23155, mp-111, mp-753304, mp-632250
@@ -61,7 +89,11 @@ n_prev_zip_files = glob(f"{ph_docs_dir}/*.zip")
 for mp_id in pbar:
     try:
         pbar.set_postfix_str(f"{mp_id}")
-        zip_path = fetch_togo_doc_by_id(mp_id)
+        try:
+            zip_path = fetch_togo_doc_by_id(mp_id)
+        except requests.HTTPError as exc:
+            print(f"{mp_id=}: {exc}")
+            continue
         if not zip_path.endswith(".zip"):
             raise ValueError(f"Unexpected {zip_path=}")
 
@@ -85,30 +117,37 @@ print(f"{n_new_zip_files - n_prev_zip_files} new zip files fetched")
 
 
 # %% convert phonondb docs to lzma compressed JSON which is much faster to load
-zip_files = glob(f"{ph_docs_dir}/mp-*-pbe.zip")
-lzma_files = glob(f"{ph_docs_dir}/mp-*-pbe.json.lzma")
+# list the docs dir once and group files by MP ID instead of globbing per material
+zip_docs = index_ph_docs(glob(f"{ph_docs_dir}/mp-*-pbe.zip"))
+pmg_docs = index_ph_docs(glob_ph_docs(ph_docs_dir, "mp-*-pbe"))
 
-ids_todo = {
-    re.match(r"(mp-\d+)-", zip_path.split("/")[-1])[1] for zip_path in zip_files
-} - {re.match(r"(mp-\d+)-", lzma_path.split("/")[-1])[1] for lzma_path in lzma_files}
+ids_todo = zip_docs.keys() - pmg_docs.keys()
 
 print(
-    f"total downloaded: {len(zip_files)}, total converted: {len(lzma_files)}, "
+    f"total downloaded: {len(zip_docs)}, total converted: {len(pmg_docs)}, "
     f"left todo: {len(ids_todo)}"
 )
 
 
 # %%
-for mat_id in (pbar := tqdm(ids_todo, desc="Parsing PhononDB docs to PMG lzma")):
-    # mat_id = "-".join(zip_path.split("/")[-1].split("-")[:2])
-    if not re.match(r"mp-\d+", mat_id):
-        raise ValueError(f"Invalid {mat_id=}")
-    existing_lzma_docs = glob(f"{ph_docs_dir}/{mat_id}-*-pbe.json.lzma")
-    if len(existing_lzma_docs) > 1:
-        raise RuntimeError(f"> 1 doc for {mat_id=}: {existing_lzma_docs}")
-    zip_docs = glob(f"{ph_docs_dir}/{mat_id}-*-pbe.zip")
-    if len(zip_docs) > 1:
-        raise RuntimeError(f"> 1 doc for {mat_id=}: {zip_docs}")
-
-    pbar.set_postfix_str(mat_id)
-    phonondb_doc_to_pmg_lzma(zip_docs[0], existing="skip")
+for mat_id, paths in [*zip_docs.items(), *pmg_docs.items()]:
+    if len(paths) > 1:
+        raise RuntimeError(f"> 1 doc for {mat_id=}: {paths}")
+zip_paths_todo = [zip_docs[mat_id][0] for mat_id in ids_todo]
+
+# parsing phonopy docs + LZMA compression is CPU-bound and independent per material,
+# so spread it over all cores
+with _fork_pool(os.cpu_count()) as executor:
+    futures = [
+        executor.submit(
+            phonondb_doc_to_pmg_lzma,
+            zip_path,
+            existing="skip",
+            existing_docs=pmg_docs,
+        )
+        for zip_path in zip_paths_todo
+    ]
+    for future in tqdm(
+        as_completed(futures), total=len(futures), desc="Parsing PhononDB docs to PMG"
+    ):
+        future.result()
@@ -1,7 +1,6 @@
 """Locally run atomate2 PhononMaker on PhononDB, MP or GNoME supercells."""
 
 # %%
-import json
 import os
 import re
 import shutil
@@ -18,14 +17,13 @@ from atomate2.common.schemas.phonons import PhononBSDOSDoc as Atomate2PhononBSDO
 from atomate2.forcefields.flows.phonons import PhononMaker
 from IPython.display import display
 from jobflow import run_locally
-from monty.io import zopen
-from monty.json import MontyDecoder, MontyEncoder
 from pymatviz.enums import Key
 from tqdm import tqdm
 
 from ffonons import DATA_DIR, PDF_FIGS, ROOT
 from ffonons.dbs.phonondb import PhononDBDocParsed
 from ffonons.enums import DB, Model
+from ffonons.io import dump_ph_doc, load_ph_doc
 from ffonons.plots import plotly_title
 
 __author__ = "Janosh Riebesell"
@@ -132,8 +130,7 @@ for dft_doc_path in (pbar := tqdm(missing_paths)):  # PhononDB
     if not re.match(r"mp-\d+", mat_id):
         raise ValueError(f"Invalid {mat_id=}")
 
-    with zopen(dft_doc_path, mode="rt") as file:
-        phonondb_doc: PhononDBDocParsed = json.load(file, cls=MontyDecoder)
+    phonondb_doc: PhononDBDocParsed = load_ph_doc(dft_doc_path)
 
     struct = phonondb_doc.structure
     supercell = phonondb_doc.supercell
@@ -173,8 +170,7 @@ for dft_doc_path in (pbar := tqdm(missing_paths)):  # PhononDB
             last_job_id = phonon_flow[-1].uuid
             ml_phonon_doc: Atomate2PhononBSDOSDoc = result[last_job_id][1].output
 
-            with zopen(ml_doc_path, mode="wt") as file:
-                json.dump(ml_phonon_doc, file, cls=MontyEncoder)
+            dump_ph_doc(ml_phonon_doc, ml_doc_path)
 
             ml_bs, ml_dos = ml_phonon_doc.phonon_bandstructure, ml_phonon_doc.phonon_dos
             bands_dict = {model.label: ml_bs}
@@ -32,8 +32,11 @@ def mock_phonon_docs() -> dict[str, dict[str, PhononBSDOSDoc]]:
     structure = Structure(np.eye(3) * 5, ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
     mock_band_structure = MagicMock(spec=PhononBandStructureSymmLine)
     mock_band_structure.bands = np.array([[-1, 0, 1], [2, 3, 4]])
-    mock_band_structure.has_imaginary_freq.return_value = True
-    mock_band_structure.has_imaginary_gamma_freq.return_value = False
+    # Gamma is the 2nd q-point so the imaginary mode is not at Gamma
+    mock_band_structure.qpoints = [
+        MagicMock(frac_coords=np.array(frac_coords))
+        for frac_coords in ([0.5, 0, 0], [0, 0, 0], [0.5, 0.5, 0])
+    ]
     mock_dos = MagicMock(spec=PhononDos)
     mock_dos.get_last_peak.return_value = 10.5
     mock_dos.mae.return_value = 0.1
@@ -6,17 +6,24 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
-import pandas as pd
 import pytest
+import requests
 from pymatgen.core import Lattice, Structure
 from pymatgen.phonon import PhononBandStructureSymmLine, PhononDos
 
 from ffonons import TEST_FILES
 from ffonons.dbs.phonondb import (
     PhononDBDocParsed,
+    RateLimiter,
+    download_files,
     fetch_togo_doc_by_id,
+    get_mat_id_from_path,
     get_phonopy_kpath,
+    get_thermo_props,
+    index_ph_docs,
+    load_mp_togo_id_maps,
     parse_phonondb_docs,
+    ph_docs_dir,
     phonondb_doc_to_pmg_lzma,
     scrape_and_fetch_togo_docs_from_page,
 )
@@ -33,6 +40,26 @@ def _mock_mp_togo_id_maps() -> Generator[None, None, None]:
         yield
 
 
+def test_load_mp_togo_id_maps(tmp_path: Path) -> None:
+    csv_path = tmp_path / "map-mp-id-togo-id.csv"
+    csv_path.write_text("mp_id,togo_id\nmp-1,abc\nmp-2,def\n")
+
+    mp_to_togo, togo_to_mp = load_mp_togo_id_maps(str(csv_path))
+    assert mp_to_togo == {"mp-1": "abc", "mp-2": "def"}
+    assert togo_to_mp == {"abc": "mp-1", "def": "mp-2"}
+    assert os.path.isfile(f"{csv_path}.pkl")
+
+    # cached maps are reused while the pickle is newer than the CSV
+    with patch("ffonons.dbs.phonondb.pd.read_csv") as mock_read_csv:
+        assert load_mp_togo_id_maps(str(csv_path)) == (mp_to_togo, togo_to_mp)
+    mock_read_csv.assert_not_called()
+
+    # and refreshed once the CSV changes
+    csv_path.write_text("mp_id,togo_id\nmp-3,ghi\n")
+    os.utime(csv_path, (1e10, 1e10))
+    assert load_mp_togo_id_maps(str(csv_path))[0] == {"mp-3": "ghi"}
+
+
 def test_fetch_togo_doc_by_id_existing_file(tmp_path: Path) -> None:
     file_path = tmp_path / "mp-1-1-pbe.zip"
     file_path.touch()
@@ -42,37 +69,114 @@ def test_fetch_togo_doc_by_id_existing_file(tmp_path: Path) -> None:
     assert result == str(file_path)
 
 
-@patch("ffonons.dbs.phonondb.requests.get")
+@patch("ffonons.dbs.phonondb.http_session.get")
 def test_fetch_togo_doc_by_id_download(mock_get: MagicMock, tmp_path: Path) -> None:
-    mock_get.return_value.content = b"mock content"
+    mock_resp = mock_get.return_value.__enter__.return_value
+    mock_resp.iter_content.return_value = [b"mock ", b"content"]
 
     result = fetch_togo_doc_by_id("mp-1", f"{tmp_path}/mp-1-1-pbe.zip")
 
     assert result == f"{tmp_path}/mp-1-1-pbe.zip"
     assert (tmp_path / "mp-1-1-pbe.zip").read_bytes() == b"mock content"
+    # partial download file was renamed to the final path
+    assert not (tmp_path / "mp-1-1-pbe.zip.part").exists()
+    assert mock_get.call_args.kwargs["stream"] is True
+
+
+@patch("ffonons.dbs.phonondb.http_session.get")
+def test_fetch_togo_doc_by_id_http_error(mock_get: MagicMock, tmp_path: Path) -> None:
+    mock_resp = mock_get.return_value.__enter__.return_value
+    mock_resp.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
 
+    with pytest.raises(requests.HTTPError, match="404 Not Found"):
+        fetch_togo_doc_by_id("mp-1", f"{tmp_path}/mp-1-1-pbe.zip")
 
-@patch("ffonons.dbs.phonondb.requests.get")
-@patch("ffonons.dbs.phonondb.BeautifulSoup")
+    # no (partial) file is left behind for failed downloads
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("ffonons.dbs.phonondb.http_session.get")
 @patch("ffonons.dbs.phonondb.os.path.isfile", return_value=False)
 @patch("ffonons.dbs.phonondb.open", new_callable=MagicMock)
+@patch("ffonons.dbs.phonondb.os.replace")
 def test_scrape_and_fetch_togo_docs_from_page(
+    mock_replace: MagicMock,  # noqa: ARG001
     mock_open: MagicMock,  # noqa: ARG001
     mock_isfile: MagicMock,  # noqa: ARG001
-    mock_beau_soup: MagicMock,
     mock_get: MagicMock,
 ) -> None:
-    mock_get.return_value.text = "<html>mock content</html>"
-    mock_beau_soup.return_value.find_all.return_value = [
-        MagicMock(prettify=lambda: '<tr id="document_1"><a class="">1</a></tr>')
-    ]
+    mock_get.return_value.text = """<html><body><table>
+        <tr id="header"><th>Title</th></tr>
+        <tr id="document_abc123"><td><a class="" href="/abc123">Si 1</a></td></tr>
+    </table></body></html>"""
     mock_get.return_value.status_code = 200
 
     result = scrape_and_fetch_togo_docs_from_page("http://mock.url")
 
-    assert isinstance(result, pd.DataFrame)
-    assert "doc_ids" in result.columns
-    assert "download_urls" in result.columns
+    # only the document row is parsed, header row is skipped
+    assert result == [
+        {
+            "mp_id": "mp-1",
+            "doc_id": "abc123",
+            "url": "https://mdr.nims.go.jp/download_all/abc123.zip",
+            "out_path": f"{ph_docs_dir}/mp-1-abc123-pbe.zip",
+        }
+    ]
+
+
+@patch("ffonons.dbs.phonondb.download_file")
+def test_download_files(mock_download_file: MagicMock) -> None:
+    def fake_download(url: str, out_path: str) -> str:
+        if "bad" in url:
+            raise requests.HTTPError("404 Not Found")
+        return out_path
+
+    mock_download_file.side_effect = fake_download
+    pairs = [("https://x/a.zip", "a.zip"), ("https://x/bad.zip", "bad.zip")]
+
+    # failed downloads are dropped, order of successful ones is preserved
+    assert download_files(pairs, on_error="ignore") == ["a.zip"]
+    assert mock_download_file.call_count == 2
+
+    with pytest.raises(requests.HTTPError, match="404 Not Found"):
+        download_files(pairs, on_error="raise")
+
+
+@patch("ffonons.dbs.phonondb.time.sleep")
+def test_rate_limiter(mock_sleep: MagicMock) -> None:
+    rate_limiter = RateLimiter(max_rps=10)
+    for _ in range(3):
+        rate_limiter.wait()
+
+    # first call goes through, later ones wait for their 0.1 s slot
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == 2
+    assert delays == pytest.approx([0.1, 0.2], abs=0.01)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("data/phonon-db/mp-149-k3569900j-pbe.zip", "mp-149"),
+        ("mp-643101-Si2-pbe.json.lzma", "mp-643101"),
+        ("ph-docs/mp-1-Fe-mace-y7uhwpje.msgpack.zst", "mp-1"),
+    ],
+)
+def test_get_mat_id_from_path(path: str, expected: str) -> None:
+    assert get_mat_id_from_path(path) == expected
+
+
+def test_get_mat_id_from_path_invalid() -> None:
+    with pytest.raises(ValueError, match="file name must start with an MP ID"):
+        get_mat_id_from_path("mp-149/k3569900j-pbe.zip")
+
+
+def test_index_ph_docs() -> None:
+    paths = ["d/mp-1-a-pbe.zip", "d/mp-2-b-pbe.zip", "d/mp-1-c-pbe.zip"]
+    assert index_ph_docs(paths) == {
+        "mp-1": ["d/mp-1-a-pbe.zip", "d/mp-1-c-pbe.zip"],
+        "mp-2": ["d/mp-2-b-pbe.zip"],
+    }
 
 
 def test_get_phonopy_kpath() -> None:
@@ -87,6 +191,39 @@ def test_get_phonopy_kpath() -> None:
     assert len(result) == 2
 
 
+def test_get_thermo_props() -> None:
+    freqs = np.linspace(-1, 12, 301)
+    ph_dos = PhononDos(frequencies=freqs, densities=np.exp(-((freqs - 5) ** 2) / 8))
+    struct = Structure(
+        lattice=Lattice.cubic(3),
+        species=("Fe", "Fe"),
+        coords=((0, 0, 0), (0.5, 0.5, 0.5)),
+    )
+    temps = np.arange(0, 500, 10)
+
+    thermo_props = get_thermo_props(ph_dos, temps, structure=struct)
+
+    # must match pymatgen's per-temperature methods incl. T=0 special cases
+    for vals, method in zip(
+        thermo_props,
+        (
+            ph_dos.helmholtz_free_energy,
+            ph_dos.entropy,
+            ph_dos.internal_energy,
+            ph_dos.cv,
+        ),
+        strict=True,
+    ):
+        assert vals.shape == temps.shape
+        expected = [method(temp=temp, structure=struct) for temp in temps]
+        np.testing.assert_allclose(vals, expected, rtol=1e-10)
+
+    # no overflow of sinh(h*nu/2k_BT) for high frequencies at very low temperatures
+    high_freq_dos = PhononDos(frequencies=freqs * 10, densities=ph_dos.densities)
+    for vals in get_thermo_props(high_freq_dos, [0.1, 1]):
+        assert np.isfinite(vals).all()
+
+
 phonondb_zip_file_path = f"{TEST_FILES}/phonondb/mp-643101-k3569900j-pbe.zip"
 
 
@@ -124,6 +261,43 @@ def test_phonondb_doc_to_pmg_lzma(tmp_path: Path) -> None:
     ]
 
 
+@patch("ffonons.dbs.phonondb.dump_ph_doc")
+@patch("ffonons.dbs.phonondb.parse_phonondb_docs")
+def test_phonondb_doc_to_pmg_lzma_update(
+    mock_parse: MagicMock, mock_dump: MagicMock, tmp_path: Path
+) -> None:
+    pmg_doc_path = f"{tmp_path}/mp-643101-k3569900j-pbe.json.lzma"
+    Path(pmg_doc_path).touch()  # newer than the ZIP file
+
+    kwargs = dict(pmg_doc_path=pmg_doc_path, existing="update")
+    out_path = phonondb_doc_to_pmg_lzma(phonondb_zip_file_path, **kwargs)
+    assert out_path == pmg_doc_path
+    mock_parse.assert_not_called()
+
+    # re-parse ZIP files modified after the existing doc was written
+    os.utime(pmg_doc_path, (0, 0))
+    phonondb_doc_to_pmg_lzma(phonondb_zip_file_path, **kwargs)
+    mock_parse.assert_called_once()
+    mock_dump.assert_called_once_with(mock_parse.return_value, pmg_doc_path)
+
+
+@patch("ffonons.dbs.phonondb.glob_ph_docs")
+@patch("ffonons.dbs.phonondb.parse_phonondb_docs")
+def test_phonondb_doc_to_pmg_lzma_existing_docs(
+    mock_parse: MagicMock, mock_glob_ph_docs: MagicMock
+) -> None:
+    existing_doc = "mp-643101-Fe-pbe.json.lzma"
+    out_path = phonondb_doc_to_pmg_lzma(
+        phonondb_zip_file_path,
+        existing="skip-silent",
+        existing_docs={"mp-643101": [existing_doc]},
+    )
+    assert out_path == existing_doc
+    # index is used instead of listing the docs dir
+    mock_glob_ph_docs.assert_not_called()
+    mock_parse.assert_not_called()
+
+
 def test_parse_phonondb_docs() -> None:
     ph_doc = parse_phonondb_docs(phonondb_zip_file_path)
     assert isinstance(ph_doc, PhononDBDocParsed)
@@ -146,3 +320,16 @@ def test_parse_phonondb_docs() -> None:
     ).items():
         val = getattr(ph_doc, key)
         assert isinstance(val, typ), f"{key=}, {typ=}, {val=}"
+
+    # values are only rounded when asked for and thermo properties are computed from
+    # the unrounded DOS, then rounded
+    ph_doc_rounded = parse_phonondb_docs(phonondb_zip_file_path, decimals=6)
+    for get_vals in (
+        lambda doc: doc.phonon_bandstructure.bands,
+        lambda doc: doc.phonon_dos.frequencies,
+        lambda doc: doc.free_energies,
+        lambda doc: doc.heat_capacities,
+    ):
+        np.testing.assert_array_equal(
+            get_vals(ph_doc_rounded), np.round(get_vals(ph_doc), 6)
+        )
@@ -1,4 +1,7 @@
+import json
+import os
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -27,16 +30,7 @@ def test_load_pymatgen_phonon_docs(mock_data_dir: Path) -> None:
     mock_ph_doc.phonon_bandstructure = MagicMock(spec=PhononBandStructureSymmLine)
     mock_ph_doc.phonon_dos = MagicMock(spec=PhononDos)
 
-    with (
-        patch("ffonons.io.zopen"),
-        patch("ffonons.io.json.load", return_value=mock_ph_doc),
-        patch("ffonons.io.re.search") as mock_search,
-    ):
-        # Mock the regex search to return the expected groups
-        mock_search.return_value.groups.side_effect = [
-            ("mp-1", "NaCl", "pbe"),
-            ("mp-2", "MgO", "ml_model"),
-        ]
+    with patch("ffonons.io.load_ph_doc", return_value=mock_ph_doc):
         result = ffonons.io.load_pymatgen_phonon_docs(docs_to_load="mp")
 
     assert len(result) == 2
@@ -47,28 +41,139 @@ def test_load_pymatgen_phonon_docs(mock_data_dir: Path) -> None:
     assert hasattr(result["mp-1"]["pbe"], "file_path")
 
 
+def test_load_pymatgen_phonon_docs_materials_ids(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    for filename in ("mp-1-NaCl-pbe", "mp-10-As-pbe", "mp-2-MgO-pbe"):
+        (mp_dir / f"{filename}.json.lzma").touch()
+
+    with patch("ffonons.io.load_ph_doc", return_value=MagicMock()):
+        result = ffonons.io.load_pymatgen_phonon_docs(
+            docs_to_load="mp", materials_ids=["mp-1", "mp-2"]
+        )
+
+    # mp-10 must not match mp-1
+    assert set(result) == {"mp-1", "mp-2"}
+
+
+def test_load_pymatgen_phonon_docs_cache_dir(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    doc_path = mp_dir / "mp-1-NaCl-pbe.json.lzma"
+    doc_path.touch()
+    cache_dir = str(mock_data_dir / "cache")
+
+    # picklable stand-in for a phonon doc that accepts file_path/mat_id attributes
+    ph_doc = SimpleNamespace(bands=[1.5, -0.25])
+    with patch("ffonons.io.load_ph_doc", return_value=ph_doc) as mock_load:
+        docs = ffonons.io.load_pymatgen_phonon_docs("mp", cache_dir=cache_dir)
+        docs_cached = ffonons.io.load_pymatgen_phonon_docs("mp", cache_dir=cache_dir)
+        assert mock_load.call_count == 1
+        assert docs_cached["mp-1"]["pbe"] == docs["mp-1"]["pbe"]
+
+        # touching a doc invalidates the cache
+        os.utime(doc_path, (0, 0))
+        ffonons.io.load_pymatgen_phonon_docs("mp", cache_dir=cache_dir)
+        assert mock_load.call_count == 2
+
+
+def test_iter_pymatgen_phonon_docs(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    for filename in ("mp-2-MgO-pbe", "mp-1-NaCl-pbe", "mp-1-NaCl-ml_model"):
+        (mp_dir / f"{filename}.json.lzma").touch()
+
+    with patch("ffonons.io.load_ph_doc", side_effect=lambda _: SimpleNamespace()):
+        doc_iter = ffonons.io.iter_pymatgen_phonon_docs("mp", verbose=False)
+        assert not isinstance(doc_iter, dict)
+        mat_docs = list(doc_iter)
+
+    # one item per material with all its models, sorted by material ID
+    assert [(mat_id, sorted(docs)) for mat_id, docs in mat_docs] == [
+        ("mp-1", ["ml_model", "pbe"]),
+        ("mp-2", ["pbe"]),
+    ]
+    assert mat_docs[1][1]["pbe"].file_path == f"{mp_dir}/mp-2-MgO-pbe.json.lzma"
+
+
+def test_iter_pymatgen_phonon_docs_early_break(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    for filename in ("mp-1-NaCl-pbe", "mp-2-MgO-pbe"):
+        (mp_dir / f"{filename}.json.lzma").touch()
+
+    executor = MagicMock()
+    executor.map.side_effect = lambda _func, paths, **_: (
+        SimpleNamespace() for _ in paths
+    )
+    pool = MagicMock()
+    pool.__enter__.return_value = executor
+    with patch("ffonons.io._fork_pool", return_value=pool):
+        doc_iter = ffonons.io.iter_pymatgen_phonon_docs(
+            "mp", verbose=False, n_workers=2
+        )
+        assert next(doc_iter)[0] == "mp-1"
+        doc_iter.close()
+
+    # stopping early cancels pending loads rather than waiting for them
+    executor.shutdown.assert_called_once_with(cancel_futures=True)
+
+
+def test_load_pymatgen_phonon_docs_skips_bad_files(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    (mp_dir / "mp-1-NaCl-pbe.json.lzma").touch()
+
+    with patch("ffonons.io.load_ph_doc", side_effect=EOFError("truncated file")):
+        result = ffonons.io.load_pymatgen_phonon_docs(docs_to_load="mp")
+
+    assert result == {}
+
+
+def test_load_pymatgen_phonon_docs_bad_file_name(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    (mp_dir / "mp-1-NaCl-pbe.json.lzma").touch()
+    (mp_dir / "mp-2.json.lzma").touch()
+
+    # file names are validated before loading any (slow to load) docs
+    with (
+        patch("ffonons.io.load_ph_doc") as mock_load,
+        pytest.raises(ValueError, match="Can't parse MP ID and model from"),
+    ):
+        ffonons.io.load_pymatgen_phonon_docs(docs_to_load="mp")
+    mock_load.assert_not_called()
+
+
 def test_update_key_name(mock_data_dir: Path) -> None:
     test_dir = mock_data_dir / "test_update"
     test_dir.mkdir()
-    (test_dir / "test_file.json.gz").touch()
+    path = ffonons.io.dump_ph_doc(
+        {"old_key": "value", "other_key": 1}, f"{test_dir}/mp-1.json.gz"
+    )
+    unchanged_path = ffonons.io.dump_ph_doc(
+        {"other_key": "old_key"}, f"{test_dir}/mp-2.msgpack.zst"
+    )
+    os.utime(unchanged_path, (0, 0))
 
-    with (
-        patch("ffonons.io.json.load") as mock_json_load,
-        patch("ffonons.io.json.dump") as mock_json_dump,
-    ):
-        mock_json_load.return_value = {"old_key": "value"}
-        ffonons.io.update_key_name(str(test_dir), {"old_key": "new_key"})
+    ffonons.io.update_key_name(str(test_dir), {"old_key": "new_key"})
 
-    mock_json_dump.assert_called_once()
-    args, _ = mock_json_dump.call_args
-    assert "new_key" in args[0]
-    assert "old_key" not in args[0]
+    assert ffonons.io.load_ph_doc(path) == {"new_key": "value", "other_key": 1}
+    # docs without the old key are left untouched (not even rewritten)
+    assert ffonons.io.load_ph_doc(unchanged_path) == {"other_key": "old_key"}
+    assert os.path.getmtime(unchanged_path) == 0
 
 
 def test_get_df_summary(mock_phonon_docs: dict[str, dict[str, PhononBSDOSDoc]]) -> None:
-    with patch("ffonons.io.load_pymatgen_phonon_docs", return_value=mock_phonon_docs):
+    with patch(
+        "ffonons.io.iter_pymatgen_phonon_docs", return_value=mock_phonon_docs.items()
+    ):
         df_summary = ffonons.io.get_df_summary("mp", cache_path=None)
 
+    # already loaded docs can be passed directly
+    df_from_docs = ffonons.io.get_df_summary(mock_phonon_docs, cache_path=None)
+    pd.testing.assert_frame_equal(df_summary, df_from_docs)
+
     assert isinstance(df_summary, pd.DataFrame)
     assert df_summary.index.names == [str(Key.mat_id), "model"]
     assert set(df_summary.columns) == {
@@ -83,24 +188,35 @@ def test_get_df_summary(mock_phonon_docs: dict[str, dict[str, PhononBSDOSDoc]])
         Key.has_imag_ph_modes,
         Key.has_imag_ph_gamma_modes,
     }
+    row = df_summary.loc[("mp-1", "pbe")]
+    assert row[Key.min_ph_freq] == -1
+    assert row[Key.max_ph_freq] == 4
+    assert row[Key.has_imag_ph_modes]
+    assert not row[Key.has_imag_ph_gamma_modes]
+    assert df_summary.dtypes.to_dict() == ffonons.io.SUMMARY_DTYPES
 
 
+@pytest.mark.parametrize("ext", [".parquet", ".csv.gz"])
 def test_get_df_summary_with_cache(
-    mock_data_dir: Path, mock_phonon_docs: dict[str, dict[str, PhononBSDOSDoc]]
+    mock_data_dir: Path,
+    mock_phonon_docs: dict[str, dict[str, PhononBSDOSDoc]],
+    ext: str,
 ) -> None:
-    cache_path = mock_data_dir / "mp" / "df-summary-tol=0.01.csv.gz"
+    cache_path = mock_data_dir / "mp" / f"df-summary-tol=0.01{ext}"
     cache_path.parent.mkdir(parents=True)
 
     assert not cache_path.exists()
 
     # Test cache creation
-    with patch("ffonons.io.load_pymatgen_phonon_docs", return_value=mock_phonon_docs):
+    with patch(
+        "ffonons.io.iter_pymatgen_phonon_docs", return_value=mock_phonon_docs.items()
+    ):
         df_summary = ffonons.io.get_df_summary("mp", cache_path=str(cache_path))
 
     assert cache_path.exists()
 
     # Test cache loading
-    with patch("ffonons.io.load_pymatgen_phonon_docs") as mock_load:
+    with patch("ffonons.io.iter_pymatgen_phonon_docs") as mock_load:
         df_summary_cached = ffonons.io.get_df_summary(
             "mp", cache_path=str(cache_path), refresh_cache=False
         )
@@ -116,13 +232,13 @@ def test_get_gnome_pmg_structures(tmp_path: Path) -> None:
 
     with patch("ffonons.io.ZipFile") as mock_zipfile:
         mock_zipfile.return_value.__enter__.return_value.namelist.return_value = [
+            "by_id/",  # directory entries don't count towards ids
             "by_id/mp-1.CIF",
             "by_id/mp-2.CIF",
+            "by_id/mp-3.CIF",
         ]
-        mock_zip_open = (
-            mock_zipfile.return_value.__enter__.return_value.open.return_value.__enter__
-        )
-        mock_zip_open.return_value.read.return_value = b"mock CIF content"
+        mock_zip_ref = mock_zipfile.return_value.__enter__.return_value
+        mock_zip_ref.read.return_value = b"mock CIF content"
 
         with patch("ffonons.io.Structure") as mock_structure:
             mock_structure.from_str.return_value = MagicMock(properties={})
@@ -145,10 +261,8 @@ def test_get_gnome_pmg_structures_with_specific_ids(tmp_path: Path) -> None:
             "by_id/mp-2.CIF",
             "by_id/mp-3.CIF",
         ]
-        mock_zip_open = (
-            mock_zipfile.return_value.__enter__.return_value.open.return_value.__enter__
-        )
-        mock_zip_open.return_value.read.return_value = b"mock CIF content"
+        mock_zip_ref = mock_zipfile.return_value.__enter__.return_value
+        mock_zip_ref.read.return_value = b"mock CIF content"
 
         with patch("ffonons.io.Structure") as mock_structure:
             mock_structure.from_str.return_value = MagicMock(properties={})
@@ -174,3 +288,88 @@ def test_get_last_peak(mp_661_mace_dos: PhononDos, mp_2789_pbe_dos: PhononDos) -
     # example material with only 1 high peak and all others tiny: mp-2789
     last_mp_2789_peak = mp_2789_pbe_dos.get_last_peak()
     assert last_mp_2789_peak == pytest.approx(55.659, abs=0.01)
+
+
+@pytest.mark.parametrize("ext", ffonons.io.PH_DOC_EXTS)
+def test_open_ph_doc_round_trip(tmp_path: Path, ext: str) -> None:
+    path = f"{tmp_path}/mp-1-Si2-pbe{ext}"
+    with ffonons.io.open_ph_doc(path, mode="wt") as file:
+        json.dump({"bands": [1.5, -0.25]}, file)
+
+    with ffonons.io.open_ph_doc(path, mode="rt") as file:
+        assert json.load(file) == {"bands": [1.5, -0.25]}
+
+    assert ffonons.io.glob_ph_docs(str(tmp_path)) == [path]
+    assert ffonons.io.glob_ph_docs(str(tmp_path), "mp-2-*") == []
+
+
+@pytest.mark.parametrize("ext", [".json.lzma", ".json.zst", ".msgpack.zst"])
+def test_dump_load_ph_doc(tmp_path: Path, ext: str) -> None:
+    struct = Structure(Lattice.cubic(3), ["Si"], [[0, 0, 0]])
+    temps = np.linspace(0, 1000, 5, dtype=np.float32)
+    ph_doc = {"structure": struct, "supercell": np.diag([2, 2, 3]), "temps": temps}
+
+    path = ffonons.io.dump_ph_doc(ph_doc, f"{tmp_path}/mp-1-Si-pbe{ext}")
+    assert path == f"{tmp_path}/mp-1-Si-pbe{ext}"
+
+    loaded = ffonons.io.load_ph_doc(path)
+    assert loaded["structure"] == struct
+    np.testing.assert_array_equal(loaded["supercell"], ph_doc["supercell"])
+    np.testing.assert_array_equal(loaded["temps"], temps)
+    assert loaded["temps"].dtype == np.float32
+
+    # without decoding, MSONable objects stay dicts
+    raw_doc = ffonons.io.load_ph_doc(path, decode=False)
+    assert raw_doc["structure"]["@class"] == "Structure"
+
+
+def test_load_ph_doc_legacy_non_finite(tmp_path: Path) -> None:
+    # docs written by the stdlib json module may contain NaN/Infinity tokens
+    path = f"{tmp_path}/mp-1-Si-pbe.json.zst"
+    with ffonons.io.open_ph_doc(path, mode="wt") as file:
+        file.write(json.dumps({"bands": [float("nan"), float("inf"), 1.5]}))
+
+    bands = ffonons.io.load_ph_doc(path)["bands"]
+    assert np.isnan(bands[0])
+    assert bands[1:] == [float("inf"), 1.5]
+
+
+@pytest.mark.parametrize("ext", [".json.zst", ".msgpack.zst"])
+def test_dump_load_ph_doc_non_finite(tmp_path: Path, ext: str) -> None:
+    ph_doc = {"dos": np.array([np.nan, 0.5, -np.inf]), "bands": [1.5, float("inf")]}
+
+    loaded = ffonons.io.load_ph_doc(
+        ffonons.io.dump_ph_doc(ph_doc, f"{tmp_path}/mp-1-Si-pbe{ext}")
+    )
+    np.testing.assert_array_equal(loaded["dos"], ph_doc["dos"])
+    assert loaded["bands"] == [1.5, float("inf")]
+
+
+@pytest.mark.parametrize("ext", [".json.gz", ".json.lzma"])
+def test_migrate_to_zstd(tmp_path: Path, ext: str) -> None:
+    old_path = ffonons.io.dump_ph_doc({"bands": [1.5, -0.25]}, f"{tmp_path}/mp-1{ext}")
+
+    new_paths = ffonons.io.migrate_to_zstd(str(tmp_path))
+    assert new_paths == [f"{tmp_path}/mp-1.json.zst"]
+    assert ffonons.io.load_ph_doc(new_paths[0]) == {"bands": [1.5, -0.25]}
+    assert os.path.isfile(old_path)
+
+    # existing .zst files are not rewritten but old files can be cleaned up
+    assert ffonons.io.migrate_to_zstd(str(tmp_path), remove_old=True) == []
+    assert not os.path.isfile(old_path)
+
+    msgpack_paths = ffonons.io.migrate_to_zstd(str(tmp_path), fmt="msgpack")
+    assert msgpack_paths == [f"{tmp_path}/mp-1.msgpack.zst"]
+    assert ffonons.io.load_ph_doc(msgpack_paths[0]) == {"bands": [1.5, -0.25]}
+
+
+def test_iter_pymatgen_phonon_docs_prefers_fastest_format(mock_data_dir: Path) -> None:
+    mp_dir = mock_data_dir / "mp"
+    mp_dir.mkdir()
+    for ext in (".json.lzma", ".msgpack.zst", ".json.gz"):
+        (mp_dir / f"mp-1-NaCl-pbe{ext}").touch()
+
+    with patch("ffonons.io.load_ph_doc", side_effect=lambda _: SimpleNamespace()):
+        mat_docs = dict(ffonons.io.iter_pymatgen_phonon_docs("mp", verbose=False))
+
+    assert mat_docs["mp-1"]["pbe"].file_path == f"{mp_dir}/mp-1-NaCl-pbe.msgpack.zst"
@@ -1,4 +1,13 @@
-from ffonons.plots import plotly_title
+import json
+
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection
+from monty.io import zopen
+from pymatgen.phonon import PhononBandStructureSymmLine
+
+from ffonons import TEST_FILES
+from ffonons.plots import plot_phonon_bands_mpl, plotly_title
 
 
 def test_plotly_title() -> None:
@@ -11,3 +20,23 @@ def test_plotly_title() -> None:
         'Fe<sub>2</sub>O<sub>3</sub>  <a href="https://example.com">example.com</a>'
     )
     assert plotly_title("Fe2O3", "https://example.com") == random_url_title
+
+
+def test_plot_phonon_bands_mpl() -> None:
+    with zopen(f"{TEST_FILES}/mp/mp-149-Si2.json.lzma", mode="rt") as file:
+        ph_bs = PhononBandStructureSymmLine.from_dict(json.load(file)["ph_bs"])
+
+    _fig, ax = plt.subplots()
+    ax = plot_phonon_bands_mpl(
+        {"PBE": ph_bs, "ML": ph_bs}, ax=ax, line_kwargs={"ML": dict(linestyles="--")}
+    )
+
+    # one LineCollection per band structure with one line per band and branch
+    assert len(ax.collections) == 2
+    for coll in ax.collections:
+        assert isinstance(coll, LineCollection)
+        assert len(coll.get_segments()) == len(ph_bs.bands) * len(ph_bs.branches)
+    assert [text.get_text() for text in ax.get_legend().get_texts()] == ["PBE", "ML"]
+    assert "Γ" in [tick.get_text() for tick in ax.get_xticklabels()]
+    assert ax.get_ylim()[1] >= np.max(ph_bs.bands)
+    plt.close(ax.figure)